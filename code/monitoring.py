@@ -1,10 +1,13 @@
 """Error tracking and monitoring utilities"""
 
+import atexit
+import inspect
 import logging
+import time
 import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, TextIO
 import json
 
 
@@ -14,11 +17,13 @@ class ErrorTracker:
     def __init__(self, log_dir: str = "logs"):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
+        # JSON-lines logs stay open (line buffered) instead of being reopened per record
+        self._jsonl_files: Dict[str, TextIO] = {}
         self.setup_logging()
 
     def setup_logging(self):
         """Configure logging with file and console handlers"""
-        log_file = self.log_dir / f"errors_{datetime.now().strftime('%Y%m%d')}.log"
+        log_file = self.log_dir / f"errors_{time.strftime('%Y%m%d')}.log"
 
         logging.basicConfig(
             level=logging.INFO,
@@ -37,12 +42,10 @@ class ErrorTracker:
             "context": context or {},
         }
 
-        self.logger.error(f"Error occurred: {error_data}")
+        self.logger.error("Error occurred: %s", error_data)
 
-        # Save detailed error to JSON file
-        error_file = self.log_dir / f"error_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(error_file, "w") as f:
-            json.dump(error_data, f, indent=2)
+        # Append detailed error to the error log (one JSON record per line)
+        self._append_jsonl("errors.jsonl", error_data)
 
     def log_performance(self, operation: str, duration: float, metadata: Optional[Dict] = None):
         """Log performance metrics"""
@@ -53,12 +56,23 @@ class ErrorTracker:
             "metadata": metadata or {},
         }
 
-        self.logger.info(f"Performance: {operation} took {duration:.2f}s")
+        self.logger.info("Performance: %s took %.2fs", operation, duration)
 
         # Append to performance log
-        perf_file = self.log_dir / "performance.jsonl"
-        with open(perf_file, "a") as f:
-            f.write(json.dumps(perf_data) + "\n")
+        self._append_jsonl("performance.jsonl", perf_data)
+
+    def _append_jsonl(self, name: str, record: Dict[str, Any]):
+        """Append one record to a JSON-lines log in the log directory"""
+        f = self._jsonl_files.get(name)
+        if f is None:
+            f = self._jsonl_files[name] = open(self.log_dir / name, "a", buffering=1)
+        f.write(json.dumps(record) + "\n")
+
+    def close(self):
+        """Close the JSON-lines logs"""
+        for f in self._jsonl_files.values():
+            f.close()
+        self._jsonl_files.clear()
 
     def health_check(self) -> Dict[str, Any]:
         """Return system health status"""
@@ -72,11 +86,24 @@ class ErrorTracker:
 
 # Global error tracker instance
 error_tracker = ErrorTracker()
+atexit.register(error_tracker.close)
 
 
 def track_errors(func):
     """Decorator to automatically track errors in functions"""
 
+    # Decide sync vs async once here, so calls take a fixed path
+    if inspect.iscoroutinefunction(func):
+
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                error_tracker.log_error(e, {"function": func.__name__, "args": str(args), "kwargs": str(kwargs)})
+                raise
+
+        return async_wrapper
+
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Test the devenviro daemon, command forwarding and argument parsing"""
+import asyncio
+import importlib
+import json
+import socket
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+# devenviro.py lives at the repository root; loaded dynamically so `mypy code/` stays scoped to code/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+devenviro = importlib.import_module("devenviro")
+
+
+class FakeEngine:
+    async def health_check(self):
+        return {"gemini": "healthy"}
+
+    def get_performance_stats(self):
+        return {"total_operations": 0}
+
+
+class NoUnixSocket(types.ModuleType):
+    """socket module without AF_UNIX, so devenviro takes its Windows (TCP) path"""
+
+    def __getattr__(self, name):
+        if name == "AF_UNIX":
+            raise AttributeError(name)
+        return getattr(socket, name)
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    async def get_engine():
+        return FakeEngine()
+
+    monkeypatch.setattr(devenviro, "_get_engine", get_engine)
+    monkeypatch.setattr(devenviro, "_global_workspace_exists", lambda: True)
+    monkeypatch.setattr(devenviro, "DAEMON_SOCKET", str(tmp_path / "daemon.sock"))
+    monkeypatch.setattr(devenviro, "DAEMON_PORT_FILE", str(tmp_path / "daemon.json"))
+    return tmp_path
+
+
+@pytest.fixture(params=["unix", "tcp"])
+def daemon(request, workspace, monkeypatch):
+    if request.param == "unix" and not hasattr(socket, "AF_UNIX"):
+        pytest.skip("Unix sockets not available")
+    if request.param == "tcp":
+        monkeypatch.setitem(sys.modules, "socket", NoUnixSocket("socket"))
+    listen_file = Path(devenviro.DAEMON_SOCKET if request.param == "unix" else devenviro.DAEMON_PORT_FILE)
+
+    thread = threading.Thread(target=asyncio.run, args=(devenviro.run_daemon(devenviro.parse_args(["daemon"])),))
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not listen_file.exists():
+        assert thread.is_alive() and time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+
+    yield request.param
+
+    devenviro._daemon_request(["stop"])
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert not listen_file.exists()
+
+
+def test_forwards_to_running_daemon(daemon):
+    assert devenviro._daemon_request(["health"]) == "DevEnviro Health Status:\n  gemini: healthy\n"
+
+
+def test_unknown_daemon_command(daemon):
+    assert devenviro._daemon_request(["bogus"]) == "Unknown daemon command: bogus\n"
+
+
+def test_invalid_daemon_arguments(daemon):
+    assert devenviro._daemon_request(["search"]) == "Invalid arguments for search\n"
+
+
+def test_rejects_bad_token(workspace, monkeypatch):
+    monkeypatch.setitem(sys.modules, "socket", NoUnixSocket("socket"))
+    thread = threading.Thread(target=asyncio.run, args=(devenviro.run_daemon(devenviro.parse_args(["daemon"])),))
+    thread.start()
+    port_file = workspace / "daemon.json"
+    deadline = time.monotonic() + 10
+    while not port_file.exists():
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+    try:
+        port = json.loads(port_file.read_text())["port"]
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as connection:
+            connection.sendall(b'{"argv": ["health"], "token": "wrong"}\n')
+            assert connection.recv(1024) == b""
+    finally:
+        devenviro._daemon_request(["stop"])
+        thread.join(timeout=10)
+
+
+def test_no_daemon_returns_none(workspace):
+    assert devenviro._daemon_request(["health"]) is None
+
+
+def test_no_daemon_runs_in_process(workspace, capsys):
+    asyncio.run(devenviro.main(devenviro.parse_args(["health"])))
+    assert capsys.readouterr().out == "DevEnviro Health Status:\n  gemini: healthy\n"
+
+
+def test_closed_without_reply_falls_back(workspace):
+    if not hasattr(socket, "AF_UNIX"):
+        pytest.skip("Unix sockets not available")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(devenviro.DAEMON_SOCKET)
+    server.listen()
+
+    def close_without_reply():
+        connection, _ = server.accept()
+        connection.recv(1024)
+        connection.close()
+
+    thread = threading.Thread(target=close_without_reply)
+    thread.start()
+    try:
+        assert devenviro._daemon_request(["health"]) is None
+    finally:
+        thread.join(timeout=10)
+        server.close()
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["test"], {"command": "test"}),
+        (["HEALTH"], {"command": "health"}),
+        (["stats"], {"command": "stats"}),
+        (["global"], {"command": "global"}),
+        (["project"], {"command": "project"}),
+        (["min"], {"command": "min"}),
+        (["full"], {"command": "full"}),
+        (["install"], {"command": "install"}),
+        (["dashboard"], {"command": "dashboard"}),
+        (["extract", "some", "text"], {"command": "extract", "text": ["some", "text"]}),
+        (["search", "query"], {"command": "search", "query": ["query"]}),
+        (["session", "wrapped", "up"], {"command": "session", "summary": ["wrapped", "up"]}),
+        (["new", "Project", "demo"], {"command": "new", "kind": "project", "project_name": "demo"}),
+        (["daemon"], {"command": "daemon", "action": None}),
+        (["daemon", "STOP"], {"command": "daemon", "action": "stop"}),
+    ],
+)
+def test_parse_args(argv, expected):
+    args = devenviro.parse_args(argv)
+    assert args.argv == argv
+    for name, value in expected.items():
+        assert getattr(args, name) == value
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["extract"], ["search"], ["session"], ["new", "thing", "demo"], ["new", "project"], ["daemon", "start"], ["bogus"]],
+)
+def test_parse_args_rejects_invalid(argv, capsys):
+    with pytest.raises(SystemExit):
+        devenviro.parse_args(argv)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Test error tracking in the monitoring utilities"""
+import asyncio
+import json
+
+import pytest
+
+import monitoring
+
+
+def _read_errors(tracker):
+    tracker.close()
+    with open(tracker.log_dir / "errors.jsonl", "r") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_track_errors_logs_async_failures(tmp_path, monkeypatch):
+    tracker = monitoring.ErrorTracker(log_dir=str(tmp_path))
+    monkeypatch.setattr(monitoring, "error_tracker", tracker)
+
+    @monitoring.track_errors
+    async def failing_operation():
+        raise ValueError("async failure")
+
+    with pytest.raises(ValueError):
+        asyncio.run(failing_operation())
+
+    records = _read_errors(tracker)
+    assert len(records) == 1
+    assert records[0]["error_type"] == "ValueError"
+    assert records[0]["error_message"] == "async failure"
+    assert records[0]["context"]["function"] == "failing_operation"
+
+
+def test_track_errors_logs_sync_failures(tmp_path, monkeypatch):
+    tracker = monitoring.ErrorTracker(log_dir=str(tmp_path))
+    monkeypatch.setattr(monitoring, "error_tracker", tracker)
+
+    @monitoring.track_errors
+    def failing_operation():
+        raise KeyError("sync failure")
+
+    with pytest.raises(KeyError):
+        failing_operation()
+
+    records = _read_errors(tracker)
+    assert [record["error_type"] for record in records] == ["KeyError"]
@@ -16,62 +16,365 @@ Usage:
   devenviro min                    # Minimal initialization
   devenviro full                   # Full system initialization
   devenviro install                # Install system-wide
+  devenviro daemon                 # Serve extract/search/health/stats from a warm engine
   devenviro --help                 # Show all options
+  devenviro <command> --profile    # Profile the run (--profile=PATH, or - to print stats)
+
+Set DEVENVIRO_INITSCOPE=1 to report import cost against call counts per module at exit.
 """
 
 import os
 import sys
 import asyncio
 import time
-import argparse
 import json
+from collections.abc import Mapping
+from functools import cache, lru_cache
 from pathlib import Path
-from datetime import datetime
-
-# Add the devenviro directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent / "devenviro"))
-
-from gemini_memory_engine import (
-    GeminiMemoryEngine,
-    extract_and_store_memory,
-    search_organizational_memory,
-    get_gemini_memory_engine,
-    capture_session_episodic_memory,
-    restore_session_continuity_brief
+from string import Template
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _enable_initscope():
+    """Record import cost and call counts per module, reported at exit (DEVENVIRO_INITSCOPE=1)"""
+    import atexit
+    import builtins
+    
+    import_times = {}
+    call_counts = {}
+    original_import = builtins.__import__
+    
+    def timed_import(name, *args, **kwargs):
+        if name in sys.modules:
+            return original_import(name, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return original_import(name, *args, **kwargs)
+        finally:
+            import_times.setdefault(name, time.perf_counter() - start)
+    
+    def count_call(frame, event, arg):
+        if event == "call":
+            module = frame.f_globals.get("__name__")
+            call_counts[module] = call_counts.get(module, 0) + 1
+    
+    def report():
+        sys.setprofile(None)
+        builtins.__import__ = original_import
+        # Costly imports that are rarely called into are the candidates for deferral
+        rows = sorted(
+            ({"module": name, "import_ms": round(elapsed * 1000, 2), "calls": call_counts.get(name, 0)}
+             for name, elapsed in import_times.items()),
+            key=lambda row: row["import_ms"] / (row["calls"] + 1),
+            reverse=True
+        )
+        print("[INITSCOPE] Costliest imports per call:")
+        for row in rows[:10]:
+            print(f"  {row['module']:<40} {row['import_ms']:>9.2f}ms  {row['calls']:>7} calls")
+        report_dir = _HOME / ".devenviro"
+        if report_dir.is_dir():
+            with open(report_dir / "initscope.json", 'w') as f:
+                json.dump(rows, f, indent=2)
+            print(f"[INFO] INITSCOPE report written to {report_dir / 'initscope.json'}")
+    
+    builtins.__import__ = timed_import
+    sys.setprofile(count_call)
+    atexit.register(report)
+
+_HOME = Path.home()
+_GLOBAL_DEVENVIRO_PATH = os.path.join(_HOME, ".devenviro")
+_SCRIPT_PATH = Path(__file__).resolve()
+
+if os.getenv("DEVENVIRO_INITSCOPE") == "1":
+    _enable_initscope()
+
+# Directory holding gemini_memory_engine and dashboard_server; added to sys.path on first use
+_MODULE_DIR = str(_SCRIPT_PATH.parent / "devenviro")
+
+# Seconds a cached (successful) service probe result is reused before probing again
+SERVICE_CACHE_TTL = 60
+
+# Contents of the Windows batch shim that puts devenviro on PATH
+BATCH_SHIM_TEMPLATE = '@echo off\npython "{script_path}" %*\n'
+
+# .gitignore written into new projects
+GITIGNORE_TEMPLATE = """# DevEnviro
+.devenviro/memory/
+*.log
+
+# Python
+__pycache__/
+*.pyc
+*.pyo
+*.pyd
+.Python
+build/
+develop-eggs/
+dist/
+downloads/
+eggs/
+.eggs/
+lib/
+lib64/
+parts/
+sdist/
+var/
+wheels/
+*.egg-info/
+.installed.cfg
+*.egg
+
+# Virtual environments
+venv/
+env/
+ENV/
+.venv/
+.env/
+"""
+
+# README.md written into new projects
+README_TEMPLATE = Template("""# $project_name
+
+## DevEnviro Cognitive Collaboration Project
+
+This project is enhanced with DevEnviro for intelligent workspace management and persistent organizational memory.
+
+### Features
+- 🧠 **Persistent Memory**: Organizational knowledge that grows with each interaction
+- 🚀 **Intelligent Workspace**: Auto-configured development environment
+- 📊 **Analytics Dashboard**: Real-time monitoring and memory management
+- 🔍 **Semantic Search**: Natural language queries across project knowledge
+
+### Quick Start
+```bash
+devenviro health     # Check system status
+devenviro search     # Search project memory
+devenviro extract    # Extract and store memories
+```
+
+### Project Structure
+```
+$project_name/
+├── src/             # Source code
+├── tests/           # Test files
+├── docs/            # Documentation
+├── .devenviro/      # DevEnviro configuration
+└── CLAUDE.md        # Project context for AI collaboration
+```
+
+### DevEnviro Integration
+- **Memory Engine**: Gemini 2.5 Flash
+- **Vector Storage**: Qdrant
+- **Workspace Type**: Project-specific with global learning
+- **Status**: ✅ Fully operational
+
+---
+Generated with DevEnviro Cognitive Collaboration Platform
+""")
+
+# CLAUDE.md written into initialized projects
+CLAUDE_MD_TEMPLATE = Template("""# $project_name - DevEnviro Project
+
+## Project Configuration
+- **Project Type**: $project_type
+- **DevEnviro Workspace**: Initialized
+- **Memory Engine**: Gemini 2.5 Flash
+- **Cognitive Collaboration**: Enabled
+
+## Project Context
+This project uses DevEnviro for cognitive collaboration and persistent organizational memory.
+
+## Usage
+```bash
+devenviro health     # Check system health
+devenviro search     # Search project memory
+devenviro extract    # Extract and store memories
+```
+
+## Notes
+- Project-specific memories are stored in `.devenviro/memory/`
+- Global memories are accessible for cross-project learning
+- Health checks ensure all systems are operational
+""")
+
+# gemini_memory_engine names still importable from this module (loaded lazily by __getattr__)
+ENGINE_EXPORTS = frozenset({
+    "GeminiMemoryEngine",
+    "extract_and_store_memory",
+    "search_organizational_memory",
+    "get_gemini_memory_engine",
+    "capture_session_episodic_memory",
+    "restore_session_continuity_brief",
+})
+
+# Where the daemon listens: a Unix socket in the global workspace, or loopback TCP on Windows
+DAEMON_SOCKET = os.path.join(_GLOBAL_DEVENVIRO_PATH, "daemon.sock")
+
+# Port and access token of a TCP daemon (user-only file); clients only connect when it exists
+DAEMON_PORT_FILE = os.path.join(_GLOBAL_DEVENVIRO_PATH, "daemon.json")
+
+# Seconds a client waits for a daemon reply before running the command itself
+DAEMON_REPLY_TIMEOUT = 60
+
+# Commands forwarded to a running daemon
+DAEMON_COMMANDS = frozenset({"extract", "search", "health", "stats"})
+
+# Commands with enough concurrent network I/O to repay loading uvloop/winloop
+FAST_LOOP_COMMANDS = frozenset({"full", "test", "health"})
+
+# Usage text printed by --help
+HELP_TEXT = """\
+DevEnviro - Cognitive Collaboration Platform
+Usage:
+  devenviro             - Auto-detect mode (current project)
+  devenviro test        - Run system test
+  devenviro extract     - Extract memory from text
+  devenviro search      - Search organizational memory
+  devenviro health      - Check system health
+  devenviro stats       - Show performance statistics
+  devenviro session     - Capture current session for continuity
+  devenviro dashboard   - Start memory analytics dashboard
+  devenviro daemon      - Keep the memory engine warm for extract/search/health/stats
+  devenviro daemon stop - Stop the running daemon
+
+Workspace Initialization:
+  devenviro global      - Initialize global workspace
+  devenviro project     - Initialize project workspace
+  devenviro new project - Create new project workspace
+  devenviro min         - Minimal initialization
+  devenviro full        - Full system initialization
+  devenviro install     - Install system-wide
+"""
+
+# Dashboard notes printed by full_init
+DASHBOARD_INFO_TEXT = """\
+[INFO] Starting DevEnviro dashboard...
+[INFO] Dashboard URL: http://127.0.0.1:8090
+[INFO] Memory search interface available
+[INFO] Analytics and monitoring active
+[INFO] Use 'devenviro dashboard' to start the web interface
+"""
+
+# Context files for cognitive collaboration as (path, parent dir, file name, description)
+CONTEXT_FILES = tuple(
+    (file_path, *file_path.rpartition("/")[::2], description)
+    for file_path, description in (
+        ("CLAUDE.md", "Claude strategic agent instructions"),
+        ("README.md", "Project documentation"),
+        (".devenviro/config.json", "DevEnviro configuration"),
+    )
+)
+
+# Commands listed after a successful auto-mode startup
+AUTO_MODE_COMMANDS = (
+    ("health", "Check system health"),
+    ("search", "Search project memory"),
+    ("extract", "Extract and store memories"),
+    ("stats", "Show performance statistics"),
+    ("global", "Initialize global workspace"),
+    ("project", "Initialize project workspace"),
+    ("full", "Full system initialization"),
+    ("session", "Capture current session for continuity"),
+    ("dashboard", "Start memory analytics dashboard"),
 )
 
+# Directories created for a new project, deepest paths only
+NEW_PROJECT_DIRS = ("src", "tests", "docs", os.path.join(".devenviro", "memory"))
+
+# Auto-mode command listing, joined once so it is written in a single call
+COMMAND_LIST_TEXT = "\n[COMMANDS] Available commands:\n" + "".join(
+    f"  devenviro {command:<10} # {description}\n" for command, description in AUTO_MODE_COMMANDS
+)
+
+# Startup header, filled in and written in a single call
+AUTO_HEADER_TMPL = (
+    "=" * 75 + "\n"
+    "  APEXSIGMA DEVENVIRO - COGNITIVE COLLABORATION PLATFORM\n"
+    + "=" * 75 + "\n"
+    "[MODE] {mode}\n"
+    "[TIME] {time}\n"
+    "[WORKSPACE] {ws}\n"
+    "\n"
+)
+
+# Marker files that identify the project type, checked in order
+PROJECT_TYPE_MARKERS = (
+    ("package.json", "Node.js/JavaScript"),
+    ("pyproject.toml", "Python"),
+    ("requirements.txt", "Python"),
+    ("pom.xml", "Java/Maven"),
+    ("build.gradle", "Java/Gradle"),
+    ("Cargo.toml", "Rust"),
+    ("go.mod", "Go"),
+)
+
+@cache
+def _cwd():
+    """Current working directory (call _cwd.cache_clear() after os.chdir)"""
+    return Path.cwd()
+
+@cache
+def _global_workspace_exists():
+    """Whether ~/.devenviro exists (call _global_workspace_exists.cache_clear() after creating it)"""
+    return os.path.isdir(_GLOBAL_DEVENVIRO_PATH)
+
+class ContextFiles(Mapping):
+    """Context file contents keyed by relative path, read from disk on first access"""
+    
+    def __init__(self):
+        self._paths = {}
+        self._contents = {}
+    
+    def add(self, key, path):
+        """Register a context file without reading it"""
+        self._paths[key] = Path(path)
+        self._contents.pop(key, None)
+    
+    def __getitem__(self, key):
+        if key not in self._contents:
+            self._contents[key] = self._paths[key].read_text(encoding='utf-8')
+        return self._contents[key]
+    
+    def __iter__(self):
+        return iter(self._paths)
+    
+    def __len__(self):
+        return len(self._paths)
+
 class DevEnviroManager:
     """Enhanced DevEnviro manager with auto-detection and comprehensive initialization"""
     
     def __init__(self):
-        self.script_dir = Path(__file__).parent
-        self.working_dir = Path.cwd()
-        self.global_devenviro = Path.home() / ".devenviro"
+        self.script_dir = _SCRIPT_PATH.parent
+        self.working_dir = _cwd()
+        self.global_devenviro = _HOME / ".devenviro"
+        self._working_entries = self._scan_dir(self.working_dir)
         self.mode = self._determine_mode()
-        self.context = {}
+        self.context = ContextFiles()
     
     def _determine_mode(self):
         """Determine initialization mode based on environment"""
-        if (self.working_dir / ".devenviro").exists():
+        if ".devenviro" in self._working_entries:
             return "project_auto"
-        elif (self.working_dir / "devenviro").exists():
+        elif "devenviro" in self._working_entries:
             return "devenviro_auto"
-        elif self.global_devenviro.exists():
+        elif _global_workspace_exists():
             return "global_auto"
         else:
             return "workspace"
     
     def print_header(self, mode="auto"):
         """Print startup header with mode info"""
-        print("=" * 75)
-        print("  APEXSIGMA DEVENVIRO - COGNITIVE COLLABORATION PLATFORM")
-        print("=" * 75)
-        print(f"[MODE] {mode.upper()}")
-        print(f"[TIME] {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"[WORKSPACE] {self.working_dir}")
-        print()
-    
-    def check_environment(self):
+        sys.stdout.write(AUTO_HEADER_TMPL.format(
+            mode=mode.upper(),
+            time=time.strftime('%Y-%m-%d %H:%M:%S'),
+            ws=self.working_dir
+        ))
+    
+    def check_environment(self, qdrant=None):
         """Check environment and API keys"""
         print("[ENV] Checking environment...")
         
@@ -83,17 +386,15 @@ class DevEnviroManager:
             print("[WARN] Gemini API key not found")
             print("[FIX] Set GEMINI_API_KEY environment variable")
         
-        # Check Qdrant
-        try:
-            import requests
-            response = requests.get("http://localhost:6333/collections", timeout=3)
-            if response.status_code == 200:
-                collections = response.json()
-                count = len(collections.get("result", {}).get("collections", []))
-                print(f"[OK] Qdrant vector database ({count} collections)")
-            else:
-                print(f"[WARN] Qdrant status: {response.status_code}")
-        except Exception:
+        # Check Qdrant (callers may have resolved the status concurrently)
+        if qdrant is None:
+            qdrant = self.qdrant_status()
+        
+        if qdrant["status"] == 200:
+            print(f"[OK] Qdrant vector database ({qdrant['collections']} collections)")
+        elif qdrant["status"] is not None:
+            print(f"[WARN] Qdrant status: {qdrant['status']}")
+        else:
             print("[INFO] Qdrant not available - vector search disabled")
             print("[OPTIONAL] Start with: docker run -p 6333:6333 qdrant/qdrant")
         
@@ -101,72 +402,164 @@ class DevEnviroManager:
     
     def load_context(self):
         """Load context files for cognitive collaboration"""
-        print("[CONTEXT] Loading context files...")
-        
-        context_files = {
-            "CLAUDE.md": "Claude strategic agent instructions",
-            "README.md": "Project documentation",
-            ".devenviro/config.json": "DevEnviro configuration"
-        }
+        # Collect the report and print it in one call
+        lines = ["[CONTEXT] Loading context files..."]
         
+        # List each parent directory once instead of probing every file
+        listings = {"": self._working_entries}
         loaded_count = 0
-        for file_path, description in context_files.items():
-            full_path = self.working_dir / file_path
-            if full_path.exists():
+        for file_path, parent, name, description in CONTEXT_FILES:
+            if parent not in listings:
+                # Subdirectories missing from the working directory listing need no scan
+                if parent in self._working_entries:
+                    listings[parent] = self._scan_dir(self.working_dir / parent)
+                else:
+                    listings[parent] = {}
+            entry = listings[parent].get(name)
+            if entry is not None:
                 try:
-                    size = full_path.stat().st_size
+                    size = entry.stat().st_size
                     loaded_count += 1
-                    print(f"[OK] {file_path} ({size/1024:.1f}KB)")
-                    self.context[file_path] = full_path.read_text(encoding='utf-8')
+                    lines.append(f"[OK] {file_path} ({size/1024:.1f}KB)")
+                    self.context.add(file_path, entry.path)
                 except Exception as e:
-                    print(f"[WARN] Could not load {file_path}: {e}")
+                    lines.append(f"[WARN] Could not load {file_path}: {e}")
         
         if loaded_count > 0:
-            print(f"[SUCCESS] Loaded {loaded_count} context files")
+            lines.append(f"[SUCCESS] Loaded {loaded_count} context files")
         else:
-            print("[INFO] No context files found")
+            lines.append("[INFO] No context files found")
         
+        print("\n".join(lines))
         return True
+    
+    def qdrant_status(self):
+        """Return the Qdrant probe result, reusing a recent one when cached"""
+        now = time.time()
+        # A cache file last written over a TTL ago cannot hold a fresh probe, so it is not parsed
+        try:
+            fresh = now - os.stat(self.global_devenviro / "service_cache.json").st_mtime <= SERVICE_CACHE_TTL
+        except OSError:
+            fresh = False
+        cache = self._load_service_cache() if fresh else {}
+        qdrant = cache.get("qdrant")
+        if not qdrant or qdrant.get("status") != 200 or now - qdrant.get("checked_at", 0) > SERVICE_CACHE_TTL:
+            qdrant = self._probe_qdrant()
+            qdrant["checked_at"] = time.time()
+            # Only a reachable Qdrant is cached, so one that comes back up is seen on the next check
+            if qdrant["status"] == 200:
+                cache["qdrant"] = qdrant
+                self._save_service_cache(cache)
+        return qdrant
+    
+    def _probe_qdrant(self):
+        """Query the local Qdrant instance for its status and collection count"""
+        from http.client import HTTPConnection
+        
+        connection = HTTPConnection("localhost", 6333, timeout=3)
+        try:
+            connection.request("GET", "/collections")
+            response = connection.getresponse()
+            if response.status == 200:
+                collections = _json_loads(response.read())
+                count = len(collections.get("result", {}).get("collections", []))
+                return {"status": 200, "collections": count}
+            return {"status": response.status}
+        except Exception:
+            return {"status": None}
+        finally:
+            connection.close()
+    
+    def _load_service_cache(self):
+        """Load cached service probe results from the global workspace"""
+        try:
+            return _json_loads((self.global_devenviro / "service_cache.json").read_bytes())
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_service_cache(self, cache):
+        """Persist service probe results (only once the global workspace exists)"""
+        if not _global_workspace_exists():
+            return
+        cache_file = self.global_devenviro / "service_cache.json"
+        tmp_file = _temp_path(cache_file)
+        content = orjson.dumps(cache) if orjson else json.dumps(cache).encode('utf-8')
+        try:
+            tmp_file.write_bytes(content)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _scan_dir(directory):
+        """List a directory once as {name: DirEntry}; empty if it cannot be read"""
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name: entry for entry in entries}
+        except OSError:
+            return {}
 
-async def main():
-    """Main entry point for DevEnviro"""
-    manager = DevEnviroManager()
+def __getattr__(name):
+    """Resolve the memory engine names this module used to re-export on first access"""
+    if name in ENGINE_EXPORTS:
+        _ensure_module_path()
+        import gemini_memory_engine
+        return getattr(gemini_memory_engine, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _ensure_module_path():
+    """Make the devenviro modules importable (they pull in the Gemini/Qdrant SDKs)"""
+    if _MODULE_DIR not in sys.path:
+        sys.path.insert(0, _MODULE_DIR)
+
+async def _get_engine():
+    """Return the process-wide memory engine, importing and initializing it on first use"""
+    _ensure_module_path()
+    from gemini_memory_engine import get_gemini_memory_engine
     
+    return await get_gemini_memory_engine()
+
+async def main(args=None):
+    """Main entry point for DevEnviro (args is None for auto-detection)"""
     # If no arguments, run auto-detection
-    if len(sys.argv) == 1:
+    if args is None:
+        # Only auto-detection needs the manager's mode and workspace probing
+        manager = DevEnviroManager()
         manager.print_header(manager.mode)
-        manager.check_environment()
+        
+        # Probe Qdrant and start the memory engine concurrently; report in order afterwards
+        qdrant, engine = await asyncio.gather(
+            asyncio.to_thread(manager.qdrant_status),
+            _get_engine(),
+            return_exceptions=True
+        )
+        if isinstance(qdrant, Exception):
+            qdrant = {"status": None}
+        manager.check_environment(qdrant)
         manager.load_context()
         
         try:
-            engine = GeminiMemoryEngine()
-            await engine.initialize()
+            if isinstance(engine, Exception):
+                raise engine
             health = await engine.health_check()
             
-            print("[SYSTEM] DevEnviro Status:")
-            for component, status in health.items():
-                print(f"  {component}: {status}")
+            sys.stdout.write("[SYSTEM] DevEnviro Status:\n" + "".join(
+                f"  {component}: {status}\n" for component, status in health.items()
+            ))
             
             print(f"\n[SUCCESS] DevEnviro ready in {manager.mode} mode")
             
             # Show recent session continuity
             try:
+                from gemini_memory_engine import restore_session_continuity_brief
+                
                 continuity = await restore_session_continuity_brief()
                 if "No recent session context" not in continuity:
                     print(f"\n[CONTINUITY] {continuity}")
             except Exception as e:
                 print(f"[INFO] Session continuity unavailable: {e}")
             
-            print("\n[COMMANDS] Available commands:")
-            print("  devenviro health     # Check system health")
-            print("  devenviro search     # Search project memory")
-            print("  devenviro extract    # Extract and store memories")
-            print("  devenviro stats      # Show performance statistics")
-            print("  devenviro global     # Initialize global workspace")
-            print("  devenviro project    # Initialize project workspace")
-            print("  devenviro full       # Full system initialization")
-            print("  devenviro session    # Capture current session for continuity")
-            print("  devenviro dashboard  # Start memory analytics dashboard")
+            sys.stdout.write(COMMAND_LIST_TEXT)
             
         except Exception as e:
             print(f"[ERROR] Memory system initialization failed: {e}")
@@ -174,86 +567,42 @@ async def main():
         
         return
     
-    # Handle specific commands
-    if len(sys.argv) < 2:
-        print("DevEnviro - Cognitive Collaboration Platform")
-        print("Usage:")
-        print("  devenviro test        - Run system test")
-        print("  devenviro extract     - Extract memory from stdin")
-        print("  devenviro search      - Search organizational memory")
-        print("  devenviro health      - Check system health")
-        print("  devenviro stats       - Show performance statistics")
-        print("")
-        print("Workspace Initialization:")
-        print("  devenviro global      - Initialize global workspace")
-        print("  devenviro project     - Initialize project workspace")
-        print("  devenviro new project - Create new project workspace")
-        print("  devenviro min         - Minimal initialization")
-        print("  devenviro full        - Full system initialization")
-        print("  devenviro install     - Install system-wide")
-        return
-    
-    command = sys.argv[1].lower()
+    # Reuse a running daemon's warm engine when one is listening
+    if args.command in DAEMON_COMMANDS:
+        output = _daemon_request(args.argv)
+        if output is not None:
+            sys.stdout.write(output)
+            return
     
     try:
-        if command == "test":
-            await test_system()
-        elif command == "extract":
-            await extract_memory()
-        elif command == "search":
-            await search_memory()
-        elif command == "health":
-            await health_check()
-        elif command == "stats":
-            await show_stats()
-        elif command == "global":
-            await initialize_global()
-        elif command == "project":
-            await initialize_project()
-        elif command == "new" and len(sys.argv) > 2 and sys.argv[2].lower() == "project":
-            await create_new_project()
-        elif command == "min":
-            await minimal_init()
-        elif command == "full":
-            await full_init()
-        elif command == "install":
-            await install_system()
-        elif command == "session":
-            await capture_session()
-        elif command == "dashboard":
-            await start_dashboard()
-        else:
-            print(f"Unknown command: {command}")
-            sys.exit(1)
+        await COMMANDS[args.command](args)
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
 
-async def test_system():
+async def test_system(args=None):
     """Test the DevEnviro system"""
     print("Testing DevEnviro system...")
     
-    engine = GeminiMemoryEngine()
-    await engine.initialize()
-    
-    health = await engine.health_check()
-    print(f"Health Status: {health}")
+    engine = await _get_engine()
     
-    # Test extraction
+    # Health check and test extraction are independent roundtrips - run them together
     test_content = "Testing DevEnviro memory extraction system."
-    extraction = await engine.extract_memory(test_content)
+    health, extraction = await asyncio.gather(
+        engine.health_check(),
+        engine.extract_memory(test_content)
+    )
+    print(f"Health Status: {health}")
     print(f"Extraction test: {'PASS' if extraction['success'] else 'FAIL'}")
     
     stats = engine.get_performance_stats()
     print(f"Performance: {stats}")
 
-async def extract_memory():
+async def extract_memory(args):
     """Extract memory from provided text"""
-    if len(sys.argv) < 3:
-        print("Usage: devenviro extract <text>")
-        return
-    
-    text = " ".join(sys.argv[2:])
+    text = " ".join(args.text)
+    _ensure_module_path()
+    from gemini_memory_engine import extract_and_store_memory
     result = await extract_and_store_memory(text)
     
     if result["extraction"]["success"]:
@@ -263,48 +612,70 @@ async def extract_memory():
     else:
         print("Memory extraction failed")
 
-async def search_memory():
+async def search_memory(args):
     """Search organizational memory"""
-    if len(sys.argv) < 3:
-        print("Usage: devenviro search <query>")
-        return
-    
-    query = " ".join(sys.argv[2:])
+    query = " ".join(args.query)
+    _ensure_module_path()
+    from gemini_memory_engine import search_organizational_memory
     results = await search_organizational_memory(query)
     
     print(f"Found {len(results)} memories:")
     for i, result in enumerate(results):
         print(f"  {i+1}. [{result['category']}] {result['text'][:100]}...")
 
-async def health_check():
+async def health_check(args=None):
     """Check system health"""
-    engine = await get_gemini_memory_engine()
+    engine = await _get_engine()
     health = await engine.health_check()
     
     print("DevEnviro Health Status:")
     for component, status in health.items():
         print(f"  {component}: {status}")
 
-async def show_stats():
+async def show_stats(args=None):
     """Show performance statistics"""
-    engine = await get_gemini_memory_engine()
+    engine = await _get_engine()
     stats = engine.get_performance_stats()
     
     print("DevEnviro Performance Statistics:")
     for key, value in stats.items():
         print(f"  {key}: {value}")
 
-async def initialize_global():
+def _json_loads(data):
+    """Parse JSON text or bytes (orjson when available)"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _write_config(config_file, config):
+    """Write a JSON config file, skipping the write when the content is unchanged"""
+    if orjson:
+        content = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        content = json.dumps(config, indent=2).encode('utf-8')
+    config_file = Path(config_file)
+    try:
+        if config_file.read_bytes() == content:
+            return
+    except OSError:
+        pass
+    # Write beside the target and swap it in, so a crash never leaves a truncated config
+    tmp_file = _temp_path(config_file)
+    tmp_file.write_bytes(content)
+    os.replace(tmp_file, config_file)
+
+def _temp_path(path):
+    """Temporary file beside path, unique to this process so concurrent writers never share one"""
+    return path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+async def initialize_global(args=None, check_health=True):
     """Initialize global workspace configuration"""
     print("Initializing global DevEnviro workspace...")
     
-    # Create global config directory
-    global_config_dir = Path.home() / ".devenviro"
-    global_config_dir.mkdir(exist_ok=True)
-    
-    # Create global memory directory
+    # Create global config and memory directories (one stat when already set up)
+    global_config_dir = _HOME / ".devenviro"
     global_memory_dir = global_config_dir / "memory"
-    global_memory_dir.mkdir(exist_ok=True)
+    if not global_memory_dir.is_dir():
+        global_memory_dir.mkdir(parents=True, exist_ok=True)
+        _global_workspace_exists.cache_clear()
     
     # Create global config file
     global_config = {
@@ -312,28 +683,30 @@ async def initialize_global():
         "workspace_type": "global",
         "memory_engine": "gemini-2.5-flash",
         "initialized": True,
-        "created_at": str(Path.cwd().resolve()),
-        "user_id": Path.home().name
+        "created_at": str(_cwd().resolve()),
+        "user_id": _HOME.name
     }
     
-    config_file = global_config_dir / "config.json"
-    with open(config_file, 'w') as f:
-        json.dump(global_config, f, indent=2)
+    _write_config(global_config_dir / "config.json", global_config)
     
     print(f"[OK] Global workspace initialized at {global_config_dir}")
     print("[OK] Global memory storage configured")
     print("[OK] Cross-project learning enabled")
     
     # Test the memory engine
-    await health_check()
+    if check_health:
+        await health_check()
 
-async def initialize_project():
+async def initialize_project(args=None, check_health=True, create_dirs=True):
     """Initialize project-specific workspace"""
     print("Initializing project DevEnviro workspace...")
     
-    project_root = Path.cwd()
+    project_root = _cwd()
     devenviro_dir = project_root / ".devenviro"
-    devenviro_dir.mkdir(exist_ok=True)
+    # Create the workspace and its memory directory in one call (one stat when already set up)
+    memory_dir = devenviro_dir / "memory"
+    if create_dirs and not memory_dir.is_dir():
+        os.makedirs(memory_dir, exist_ok=True)
     
     # Create project config
     project_config = {
@@ -346,168 +719,63 @@ async def initialize_project():
         "created_at": str(project_root.resolve())
     }
     
-    config_file = devenviro_dir / "config.json"
-    with open(config_file, 'w') as f:
-        json.dump(project_config, f, indent=2)
+    _write_config(devenviro_dir / "config.json", project_config)
     
-    # Create project memory directory
-    memory_dir = devenviro_dir / "memory"
-    memory_dir.mkdir(exist_ok=True)
-    
-    # Create CLAUDE.md for project context
+    # Create CLAUDE.md for project context (exclusive create keeps an existing one)
     claude_md = project_root / "CLAUDE.md"
-    if not claude_md.exists():
-        claude_content = f"""# {project_root.name} - DevEnviro Project
-
-## Project Configuration
-- **Project Type**: {detect_project_type(project_root)}
-- **DevEnviro Workspace**: Initialized
-- **Memory Engine**: Gemini 2.5 Flash
-- **Cognitive Collaboration**: Enabled
-
-## Project Context
-This project uses DevEnviro for cognitive collaboration and persistent organizational memory.
-
-## Usage
-```bash
-devenviro health     # Check system health
-devenviro search     # Search project memory
-devenviro extract    # Extract and store memories
-```
-
-## Notes
-- Project-specific memories are stored in `.devenviro/memory/`
-- Global memories are accessible for cross-project learning
-- Health checks ensure all systems are operational
-"""
-        with open(claude_md, 'w') as f:
-            f.write(claude_content)
+    try:
+        with open(claude_md, 'x', encoding='utf-8') as f:
+            f.write(CLAUDE_MD_TEMPLATE.substitute(
+                project_name=project_root.name,
+                project_type=detect_project_type(str(project_root.resolve()))
+            ))
+    except FileExistsError:
+        pass
     
     print(f"[OK] Project workspace initialized in {devenviro_dir}")
     print(f"[OK] Project memory storage configured")
     print(f"[OK] CLAUDE.md created for project context")
     
     # Test the memory engine
-    await health_check()
+    if check_health:
+        await health_check()
 
-async def create_new_project():
+async def create_new_project(args):
     """Create a new project workspace with full setup"""
-    if len(sys.argv) < 4:
-        print("Usage: devenviro new project <project_name>")
-        return
-    
-    project_name = sys.argv[3]
-    project_dir = Path.cwd() / project_name
+    project_name = args.project_name
+    project_dir = _cwd() / project_name
     
     print(f"Creating new project: {project_name}")
     
-    # Create project directory
-    project_dir.mkdir(exist_ok=True)
+    # Create the project directory, its basic structure and the workspace in one pass
+    for directory in NEW_PROJECT_DIRS:
+        os.makedirs(project_dir / directory, exist_ok=True)
     
     # Change to project directory
     os.chdir(project_dir)
+    _cwd.cache_clear()
     
-    # Initialize project workspace
-    await initialize_project()
-    
-    # Create basic project structure
-    (project_dir / "src").mkdir(exist_ok=True)
-    (project_dir / "tests").mkdir(exist_ok=True)
-    (project_dir / "docs").mkdir(exist_ok=True)
+    # Initialize project workspace (its directories exist already)
+    await initialize_project(create_dirs=False)
     
     # Create basic files
-    gitignore_content = """# DevEnviro
-.devenviro/memory/
-*.log
-
-# Python
-__pycache__/
-*.pyc
-*.pyo
-*.pyd
-.Python
-build/
-develop-eggs/
-dist/
-downloads/
-eggs/
-.eggs/
-lib/
-lib64/
-parts/
-sdist/
-var/
-wheels/
-*.egg-info/
-.installed.cfg
-*.egg
-
-# Virtual environments
-venv/
-env/
-ENV/
-.venv/
-.env/
-"""
-    
-    with open(project_dir / ".gitignore", 'w') as f:
-        f.write(gitignore_content)
-    
-    readme_content = f"""# {project_name}
-
-## DevEnviro Cognitive Collaboration Project
-
-This project is enhanced with DevEnviro for intelligent workspace management and persistent organizational memory.
-
-### Features
-- 🧠 **Persistent Memory**: Organizational knowledge that grows with each interaction
-- 🚀 **Intelligent Workspace**: Auto-configured development environment
-- 📊 **Analytics Dashboard**: Real-time monitoring and memory management
-- 🔍 **Semantic Search**: Natural language queries across project knowledge
-
-### Quick Start
-```bash
-devenviro health     # Check system status
-devenviro search     # Search project memory
-devenviro extract    # Extract and store memories
-```
-
-### Project Structure
-```
-{project_name}/
-├── src/             # Source code
-├── tests/           # Test files
-├── docs/            # Documentation
-├── .devenviro/      # DevEnviro configuration
-└── CLAUDE.md        # Project context for AI collaboration
-```
-
-### DevEnviro Integration
-- **Memory Engine**: Gemini 2.5 Flash
-- **Vector Storage**: Qdrant
-- **Workspace Type**: Project-specific with global learning
-- **Status**: ✅ Fully operational
-
----
-Generated with DevEnviro Cognitive Collaboration Platform
-"""
+    (project_dir / ".gitignore").write_text(GITIGNORE_TEMPLATE, encoding='utf-8')
     
-    with open(project_dir / "README.md", 'w') as f:
-        f.write(readme_content)
+    readme_content = README_TEMPLATE.substitute(project_name=project_name)
+    (project_dir / "README.md").write_text(readme_content, encoding='utf-8')
     
     print(f"[OK] New project '{project_name}' created successfully")
     print(f"[OK] Project structure initialized")
     print(f"[OK] DevEnviro cognitive collaboration enabled")
     print(f"[INFO] Project location: {project_dir}")
 
-async def minimal_init():
+async def minimal_init(args=None):
     """Minimal DevEnviro initialization"""
     print("Minimal DevEnviro initialization...")
     
     # Just check if the system is working
     try:
-        engine = GeminiMemoryEngine()
-        await engine.initialize()
+        engine = await _get_engine()
         print("[OK] Memory engine: Operational")
         
         health = await engine.health_check()
@@ -523,23 +791,18 @@ async def minimal_init():
         print(f"[ERROR] Minimal initialization failed: {e}")
         print("TIP: Check your configuration and try again")
 
-async def full_init():
+async def full_init(args=None):
     """Full system initialization with dashboard"""
     print("Full DevEnviro system initialization...")
     
-    # Initialize global workspace
-    await initialize_global()
-    
-    # Initialize project workspace if in a project
-    if Path.cwd().name != Path.home().name:
-        await initialize_project()
+    # Initialize the global and project workspaces; the system test below
+    # covers the memory engine, so they skip their own health checks
+    await initialize_global(check_health=False)
+    if _cwd().resolve() != _HOME.resolve():
+        await initialize_project(check_health=False)
     
     # Start the dashboard
-    print("[INFO] Starting DevEnviro dashboard...")
-    print("[INFO] Dashboard URL: http://127.0.0.1:8090")
-    print("[INFO] Memory search interface available")
-    print("[INFO] Analytics and monitoring active")
-    print("[INFO] Use 'devenviro dashboard' to start the web interface")
+    sys.stdout.write(DASHBOARD_INFO_TEXT)
     
     # Test full system
     await test_system()
@@ -547,37 +810,39 @@ async def full_init():
     print("[OK] Full DevEnviro system initialized")
     print("[SUCCESS] Cognitive collaboration platform ready!")
 
-async def install_system():
+async def install_system(args=None):
     """Install DevEnviro system-wide"""
     print("Installing DevEnviro system-wide...")
     
     # The .bat file already exists, just verify it's working
-    import subprocess
+    import shutil
     try:
-        result = subprocess.run(["where", "devenviro"], capture_output=True, text=True)
-        if result.returncode == 0:
-            bat_path = result.stdout.strip()
+        # Search PATH in-process (honours PATHEXT on Windows) instead of spawning `where`
+        bat_path = shutil.which("devenviro")
+        if bat_path:
             print(f"[OK] DevEnviro command found at: {bat_path}")
             
-            # Verify the batch file points to the right location
-            script_path = Path(__file__).resolve()
-            expected_content = f'@echo off\npython "{script_path}" %*\n'
-            
-            try:
-                with open(bat_path, 'r') as f:
-                    current_content = f.read()
+            # Only a Windows batch shim is checked and rewritten; anything else (such as the
+            # console script pip installs on Linux/macOS) is never touched
+            if sys.platform != "win32" or not bat_path.lower().endswith((".bat", ".cmd")):
+                print("[OK] Command is not a batch file - leaving it unchanged")
+            else:
+                # Verify the batch file points to the right location; the shim is read and
+                # written as text in the console codepage, so non-ASCII paths compare equal
+                script_path = _SCRIPT_PATH
                 
-                if str(script_path) not in current_content:
-                    print(f"[WARN] Updating batch file to point to: {script_path}")
-                    with open(bat_path, 'w') as f:
-                        f.write(expected_content)
-                    print("[OK] Batch file updated")
-                else:
-                    print("[OK] Batch file is correctly configured")
-                    
-            except PermissionError:
-                print("[WARN] Permission denied updating batch file")
-                print("TIP: Run as administrator to update system files")
+                try:
+                    shim = Path(bat_path)
+                    if str(script_path) not in shim.read_text():
+                        print(f"[WARN] Updating batch file to point to: {script_path}")
+                        shim.write_text(BATCH_SHIM_TEMPLATE.format(script_path=script_path))
+                        print("[OK] Batch file updated")
+                    else:
+                        print("[OK] Batch file is correctly configured")
+                        
+                except PermissionError:
+                    print("[WARN] Permission denied updating batch file")
+                    print("TIP: Run as administrator to update system files")
         else:
             print("[ERROR] DevEnviro command not found in PATH")
             print("TIP: Please add the batch file to your PATH manually")
@@ -591,14 +856,11 @@ async def install_system():
     print("[OK] DevEnviro system installation complete")
     print("[SUCCESS] Use 'devenviro full' to initialize complete system")
 
-async def capture_session():
+async def capture_session(args):
     """Capture current session for continuity"""
-    if len(sys.argv) < 3:
-        print("Usage: devenviro session <session_summary>")
-        print("Example: devenviro session 'Fixed dashboard responsiveness and updated README'")
-        return
-    
-    session_summary = " ".join(sys.argv[2:])
+    session_summary = " ".join(args.summary)
+    _ensure_module_path()
+    from gemini_memory_engine import capture_session_episodic_memory
     
     print("Capturing session episode for continuity...")
     
@@ -620,17 +882,17 @@ async def capture_session():
     except Exception as e:
         print(f"[ERROR] Session capture failed: {e}")
 
-async def start_dashboard():
+async def start_dashboard(args=None):
     """Start the memory analytics dashboard"""
     print("Starting DevEnviro Memory Analytics Dashboard...")
     
     try:
         # Import dashboard server
-        sys.path.insert(0, str(Path(__file__).parent / "devenviro"))
-        from dashboard_server import start_dashboard_server
+        _ensure_module_path()
+        from dashboard_server import serve_dashboard
         
         # Check if memory engine is working
-        engine = await get_gemini_memory_engine()
+        engine = await _get_engine()
         health = await engine.health_check()
         
         if health["gemini"] == "healthy":
@@ -642,8 +904,8 @@ async def start_dashboard():
         print("[INFO] Dashboard will be available at: http://127.0.0.1:8090")
         print("[INFO] Press Ctrl+C to stop the server")
         
-        # Start the server (this will block)
-        start_dashboard_server()
+        # Serve on this event loop until the server shuts down
+        await serve_dashboard()
         
     except KeyboardInterrupt:
         print("\n[INFO] Dashboard server stopped")
@@ -651,28 +913,279 @@ async def start_dashboard():
         print(f"[ERROR] Dashboard startup failed: {e}")
         print("[TIP] Make sure all dependencies are installed: pip install -e .")
 
-def detect_project_type(project_path: Path) -> str:
-    """Detect the type of project based on files present"""
-    if (project_path / "package.json").exists():
-        return "Node.js/JavaScript"
-    elif (project_path / "pyproject.toml").exists() or (project_path / "requirements.txt").exists():
-        return "Python"
-    elif (project_path / "pom.xml").exists():
-        return "Java/Maven"
-    elif (project_path / "build.gradle").exists():
-        return "Java/Gradle"
-    elif (project_path / "Cargo.toml").exists():
-        return "Rust"
-    elif (project_path / "go.mod").exists():
-        return "Go"
-    elif (project_path / ".csproj").exists():
-        return "C#/.NET"
+def _encode_line(message):
+    """Encode a daemon message as one line of JSON (orjson when available)"""
+    if orjson:
+        return orjson.dumps(message) + b"\n"
+    return json.dumps(message).encode('utf-8') + b"\n"
+
+async def run_daemon(args):
+    """Serve extract/search/health/stats from one process that keeps the engine initialized"""
+    import socket
+    
+    if args.action == "stop":
+        output = _daemon_request(["stop"])
+        print(output.rstrip() if output is not None else "[INFO] DevEnviro daemon is not running")
+        return
+    
+    # Refuse to start before paying for the engine when this daemon could never serve
+    if not _global_workspace_exists():
+        print("[ERROR] Global workspace not initialized")
+        print("TIP: Run 'devenviro global' first")
+        return
+    if hasattr(socket, "AF_UNIX"):
+        if os.path.exists(DAEMON_SOCKET):
+            # Only a stale socket left by a daemon that did not shut down cleanly is replaced
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(DAEMON_SOCKET)
+                print("[INFO] DevEnviro daemon is already running")
+                return
+            except OSError:
+                os.unlink(DAEMON_SOCKET)
+            finally:
+                probe.close()
+    elif _daemon_request(["ping"]) is not None:
+        print("[INFO] DevEnviro daemon is already running")
+        return
+    
+    print("Starting DevEnviro daemon...")
+    try:
+        await _get_engine()
+        print("[OK] Memory engine initialized")
+    except Exception as e:
+        print(f"[ERROR] Memory engine initialization failed: {e}")
+        return
+    
+    # Commands share stdout, so they run one at a time
+    command_lock = asyncio.Lock()
+    stopped = asyncio.Event()
+    # TCP clients must present the token from the port file; the Unix socket is user-only instead
+    token = None
+    
+    async def handle_request(reader, writer):
+        # Diagnostics go to stderr: stdout may be redirected into another client's output
+        try:
+            line = await reader.readline()
+            if not line:
+                # A liveness probe connected and closed without sending a request
+                return
+            request = _json_loads(line)
+            if request.get("token") != token:
+                print("[WARN] Daemon request rejected: bad token", file=sys.stderr)
+                return
+            argv = request.get("argv", [])
+            command = argv[0].lower() if argv else ""
+            if command == "stop":
+                output = "[OK] DevEnviro daemon stopped\n"
+                stopped.set()
+            elif command in DAEMON_COMMANDS:
+                try:
+                    command_args = parse_args(argv)
+                except SystemExit:
+                    output = f"Invalid arguments for {command}\n"
+                else:
+                    async with command_lock:
+                        output = await _capture_command(COMMANDS[command], command_args)
+            else:
+                output = f"Unknown daemon command: {command}\n"
+            writer.write(_encode_line({"output": output}))
+            await writer.drain()
+        except Exception as e:
+            print(f"[WARN] Daemon request failed: {e}", file=sys.stderr)
+        finally:
+            writer.close()
+    
+    if hasattr(socket, "AF_UNIX"):
+        # Create the socket user-only, so no other user can connect before it is locked down
+        old_umask = os.umask(0o077)
+        try:
+            server = await asyncio.start_unix_server(handle_request, path=DAEMON_SOCKET)
+        finally:
+            os.umask(old_umask)
+        print(f"[OK] Listening on {DAEMON_SOCKET}")
+        listen_file = DAEMON_SOCKET
     else:
+        import secrets
+        
+        token = secrets.token_hex(16)
+        server = await asyncio.start_server(handle_request, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        _write_private_file(DAEMON_PORT_FILE, _encode_line({"port": port, "token": token}))
+        print(f"[OK] Listening on 127.0.0.1:{port}")
+        listen_file = DAEMON_PORT_FILE
+    print("[INFO] Stop with: devenviro daemon stop")
+    
+    try:
+        async with server:
+            await stopped.wait()
+    finally:
+        if os.path.exists(listen_file):
+            os.unlink(listen_file)
+
+def _write_private_file(path, content):
+    """Write bytes to a file only the current user can read"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(content)
+
+async def _capture_command(handler, args):
+    """Run a command handler and return what it printed"""
+    import contextlib
+    import io
+    
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            await handler(args)
+    except Exception as e:
+        output.write(f"Error: {e}\n")
+    return output.getvalue()
+
+def _daemon_request(argv):
+    """Send a command to a running daemon and return its output, or None when none is listening"""
+    import socket
+    
+    request = {"argv": argv}
+    try:
+        if hasattr(socket, "AF_UNIX"):
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                connection.connect(DAEMON_SOCKET)
+            except OSError:
+                connection.close()
+                raise
+        else:
+            # No port file means no daemon, so nothing is dialed (refused loopback connects are slow on Windows)
+            with open(DAEMON_PORT_FILE, 'rb') as f:
+                daemon = _json_loads(f.read())
+            request["token"] = daemon["token"]
+            connection = socket.create_connection(("127.0.0.1", daemon["port"]), timeout=0.5)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    
+    with connection:
+        connection.settimeout(DAEMON_REPLY_TIMEOUT)
+        try:
+            connection.sendall(_encode_line(request))
+            with connection.makefile('rb') as response:
+                return _json_loads(response.readline())["output"]
+        except (OSError, ValueError, KeyError, TypeError):
+            # Closed without a reply, a garbled reply, or no reply in time: run the command here instead
+            return None
+
+# Command handlers dispatched by main()
+COMMANDS = {
+    "test": test_system,
+    "extract": extract_memory,
+    "search": search_memory,
+    "health": health_check,
+    "stats": show_stats,
+    "global": initialize_global,
+    "project": initialize_project,
+    "min": minimal_init,
+    "full": full_init,
+    "install": install_system,
+    "session": capture_session,
+    "dashboard": start_dashboard,
+    "daemon": run_daemon,
+    "new": create_new_project,
+}
+
+def build_parser():
+    """Build the command-line parser with one subcommand per COMMANDS entry"""
+    import argparse
+    
+    # --help is served from HELP_TEXT before parsing
+    parser = argparse.ArgumentParser(prog="devenviro", add_help=False)
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    commands.required = True
+    for name in ("test", "health", "stats", "global", "project", "min", "full", "install", "dashboard"):
+        commands.add_parser(name)
+    commands.add_parser("extract").add_argument("text", nargs="+")
+    commands.add_parser("search").add_argument("query", nargs="+")
+    commands.add_parser("session").add_argument("summary", nargs="+")
+    new = commands.add_parser("new")
+    new.add_argument("kind", type=str.lower, choices=["project"])
+    new.add_argument("project_name")
+    commands.add_parser("daemon").add_argument("action", nargs="?", type=str.lower, choices=["stop"])
+    return parser
+
+def parse_args(argv):
+    """Parse command arguments (the command name is case-insensitive)"""
+    args = build_parser().parse_args([argv[0].lower(), *argv[1:]])
+    # Keep the raw arguments so the command can be forwarded to a daemon verbatim
+    args.argv = list(argv)
+    return args
+
+@lru_cache(maxsize=128)
+def detect_project_type(project_path: str) -> str:
+    """Detect the type of project based on files present (project_path should be resolved)"""
+    # One directory listing answers every marker check
+    try:
+        with os.scandir(project_path) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
         return "Generic"
+    
+    for marker, project_type in PROJECT_TYPE_MARKERS:
+        if marker in names:
+            return project_type
+    if any(name.endswith(".csproj") for name in names):
+        return "C#/.NET"
+    return "Generic"
+
+def print_help():
+    """Print command usage"""
+    sys.stdout.write(HELP_TEXT)
+
+def _pop_profile_option():
+    """Remove --profile[=PATH] from the arguments and return the profile target"""
+    for index, arg in enumerate(sys.argv[1:], 1):
+        if arg == "--profile" or arg.startswith("--profile="):
+            del sys.argv[index]
+            return arg.partition("=")[2] or "devenviro.prof"
+    return None
+
+def _use_fast_event_loop():
+    """Switch asyncio to uvloop (winloop on Windows) when it is installed"""
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(fast_loop.EventLoopPolicy())
 
 def cli_main():
     """Console script entry point"""
-    asyncio.run(main())
+    # Help is static text - print it without starting an event loop
+    if len(sys.argv) > 1 and sys.argv[1].lower() in ("--help", "-h", "help"):
+        print_help()
+        return
+    
+    profile_target = _pop_profile_option()
+    # Bare `devenviro` runs auto-detection without loading argparse
+    args = parse_args(sys.argv[1:]) if len(sys.argv) > 1 else None
+    if args is not None and args.command in FAST_LOOP_COMMANDS:
+        _use_fast_event_loop()
+    if profile_target is None:
+        asyncio.run(main(args))
+        return
+    
+    import cProfile
+    import pstats
+    
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(asyncio.run, main(args))
+    finally:
+        if profile_target == "-":
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(30)
+        else:
+            profiler.dump_stats(profile_target)
+            print(f"[INFO] Profile written to {profile_target}")
 
 if __name__ == "__main__":
     cli_main()
\ No newline at end of file
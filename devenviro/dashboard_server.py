@@ -204,52 +204,41 @@ async def get_dashboard_html():
     return get_multi_page_dashboard_html()
 
 # Server startup
+def _build_server(host: str, port: int) -> uvicorn.Server:
+    """Create the uvicorn server for the dashboard app"""
+    return uvicorn.Server(uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        log_level="info",
+        reload=False
+    ))
+
+async def serve_dashboard(host: str = "127.0.0.1", port: int = 8090):
+    """Serve the dashboard on the running event loop until it shuts down"""
+    print(f"Starting DevEnviro Memory Analytics Dashboard on {host}:{port}")
+    print(f"Dashboard URL: http://{host}:{port}")
+    
+    # Sharing the caller's loop keeps the warm memory engine usable and needs no keep-alive polling
+    await _build_server(host, port).serve()
+
 def start_dashboard_server(host: str = "127.0.0.1", port: int = 8090):
     """Start the dashboard server"""
     print(f"Starting DevEnviro Memory Analytics Dashboard on {host}:{port}")
     print(f"Dashboard URL: http://{host}:{port}")
     
     # Check if we're in an async context
-    import asyncio
     try:
         loop = asyncio.get_running_loop()
-        print("[INFO] Running in async context, creating server task...")
-        # We're in an async context, so we need to run the server differently
-        import threading
-        
-        def run_server():
-            uvicorn.run(
-                app,
-                host=host,
-                port=port,
-                log_level="info",
-                reload=False
-            )
-        
-        # Start server in a separate thread
-        server_thread = threading.Thread(target=run_server, daemon=True)
-        server_thread.start()
-        
-        print(f"[SUCCESS] Dashboard server started on {host}:{port}")
-        print("[INFO] Server is running in background thread")
-        
-        # Keep the main thread alive
-        try:
-            while True:
-                import time
-                time.sleep(1)
-        except KeyboardInterrupt:
-            print("\n[INFO] Stopping dashboard server...")
-            
     except RuntimeError:
         # No event loop running, can use uvicorn.run directly
-        uvicorn.run(
-            app,
-            host=host,
-            port=port,
-            log_level="info",
-            reload=False
-        )
+        _build_server(host, port).run()
+        return None
+    
+    # Schedule the server on the caller's loop rather than a second loop in a thread,
+    # so requests reach the engine on the loop it was created on
+    print("[INFO] Running in async context, creating server task...")
+    return loop.create_task(_build_server(host, port).serve())
 
 if __name__ == "__main__":
     start_dashboard_server()
\ No newline at end of file
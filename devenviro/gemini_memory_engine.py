@@ -5,14 +5,17 @@ Direct integration with Gemini 2.5 Flash for intelligent memory operations
 """
 
 import os
+import re
 import json
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 import hashlib
 import uuid
+from operator import itemgetter
 
 # Google AI imports
 try:
@@ -34,6 +37,12 @@ try:
 except ImportError:
     asyncpg = None
 
+# Faster JSON parsing (its decode error subclasses json.JSONDecodeError)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from dotenv import load_dotenv
 import numpy as np
 
@@ -41,6 +50,12 @@ import numpy as np
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# First fenced code block in a Gemini response (```json, ```python, or bare ```)
+CODE_BLOCK_PATTERN = re.compile(r"```(?:\w+)?\s*([\s\S]*?)\s*```")
+
+# Payload keys promoted to top-level search result fields (the rest go under "metadata")
+RESULT_FIELDS = frozenset({"text", "category", "importance", "tags", "timestamp"})
+
 class GeminiMemoryError(Exception):
     """Custom exception for Gemini memory operations"""
     pass
@@ -134,7 +149,7 @@ class GeminiMemoryEngine:
             return True
             
         except Exception as e:
-            logger.error(f"Gemini Memory Engine initialization failed: {e}")
+            logger.error("Gemini Memory Engine initialization failed: %s", e)
             raise GeminiMemoryError(f"Initialization failed: {e}")
     
     async def _initialize_gemini(self):
@@ -182,7 +197,7 @@ class GeminiMemoryEngine:
                 logger.warning("Gemini client initialized but test response unexpected")
                 
         except Exception as e:
-            logger.error(f"Gemini initialization failed: {e}")
+            logger.error("Gemini initialization failed: %s", e)
             raise GeminiMemoryError(f"Gemini setup failed: {e}")
     
     async def _initialize_qdrant(self):
@@ -212,15 +227,15 @@ class GeminiMemoryEngine:
                             distance=Distance.COSINE
                         )
                     )
-                    logger.info(f"Created Qdrant collection: {collection_name}")
+                    logger.info("Created Qdrant collection: %s", collection_name)
                 
             except Exception as e:
-                logger.warning(f"Qdrant collection setup issue: {e}")
+                logger.warning("Qdrant collection setup issue: %s", e)
             
             logger.info("Qdrant client initialized successfully")
             
         except Exception as e:
-            logger.warning(f"Qdrant initialization failed: {e}")
+            logger.warning("Qdrant initialization failed: %s", e)
             self.qdrant_client = None
     
     async def _initialize_postgres(self):
@@ -232,7 +247,7 @@ class GeminiMemoryEngine:
         """
         Extract and categorize memories from content using Gemini 2.5 Flash
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             if not self.gemini_client:
@@ -252,10 +267,10 @@ class GeminiMemoryEngine:
             
             # Track performance
             self.operation_stats["extractions"] += 1
-            response_time = (datetime.now() - start_time).total_seconds()
+            response_time = time.perf_counter() - start_time
             self.operation_stats["total_response_time"] += response_time
             
-            logger.info(f"Memory extraction completed in {response_time:.3f}s")
+            logger.info("Memory extraction completed in %.3fs", response_time)
             
             return {
                 "success": True,
@@ -266,7 +281,7 @@ class GeminiMemoryEngine:
             
         except Exception as e:
             self.operation_stats["errors"] += 1
-            logger.error(f"Memory extraction failed: {e}")
+            logger.error("Memory extraction failed: %s", e)
             raise GeminiMemoryError(f"Failed to extract memory: {e}")
     
     def _create_extraction_prompt(self, content: str, context: Optional[Dict[str, Any]]) -> str:
@@ -331,16 +346,15 @@ RESPOND ONLY WITH VALID JSON:
     def _parse_extraction_response(self, response_text: str) -> Dict[str, Any]:
         """Parse Gemini's extraction response"""
         try:
-            import re
-            # Use regex to extract the first JSON code block (handles ```json, ```python, etc.)
-            code_block_match = re.search(r"```(?:\w+)?\s*([\s\S]*?)\s*```", response_text)
+            # Extract the first JSON code block (handles ```json, ```python, etc.)
+            code_block_match = CODE_BLOCK_PATTERN.search(response_text)
             if code_block_match:
                 cleaned_response = code_block_match.group(1).strip()
             else:
                 cleaned_response = response_text.strip()
             
             # Parse JSON
-            result = json.loads(cleaned_response.strip())
+            result = orjson.loads(cleaned_response) if orjson else json.loads(cleaned_response)
             
             # Validate structure
             if "memories" not in result:
@@ -349,15 +363,15 @@ RESPOND ONLY WITH VALID JSON:
             return result
             
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse extraction response: {e}")
-            logger.error(f"Response text: {response_text}")
+            logger.error("Failed to parse extraction response: %s", e)
+            logger.error("Response text: %s", response_text)
             # Return result with explicit error for debugging
             return {
                 "memories": [],
                 "error": f"JSONDecodeError: {e}. Raw response: {response_text}"
             }
         except Exception as e:
-            logger.error(f"Error parsing extraction: {e}")
+            logger.error("Error parsing extraction: %s", e)
             return {
                 "memories": [],
                 "error": f"Exception: {e}"
@@ -374,7 +388,7 @@ RESPOND ONLY WITH VALID JSON:
         """
         Store a memory in the vector database
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             if not self.qdrant_client:
@@ -415,10 +429,10 @@ RESPOND ONLY WITH VALID JSON:
             
             # Track performance
             self.operation_stats["stores"] += 1
-            response_time = (datetime.now() - start_time).total_seconds()
+            response_time = time.perf_counter() - start_time
             self.operation_stats["total_response_time"] += response_time
             
-            logger.info(f"Memory stored successfully in {response_time:.3f}s")
+            logger.info("Memory stored successfully in %.3fs", response_time)
             
             return {
                 "success": True,
@@ -429,7 +443,7 @@ RESPOND ONLY WITH VALID JSON:
             
         except Exception as e:
             self.operation_stats["errors"] += 1
-            logger.error(f"Memory storage failed: {e}")
+            logger.error("Memory storage failed: %s", e)
             raise GeminiMemoryError(f"Failed to store memory: {e}")
     
     async def search_memory(
@@ -442,7 +456,7 @@ RESPOND ONLY WITH VALID JSON:
         """
         Search memories using vector similarity and intelligent ranking
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             if not self.qdrant_client:
@@ -494,16 +508,16 @@ RESPOND ONLY WITH VALID JSON:
             
             # Track performance
             self.operation_stats["searches"] += 1
-            response_time = (datetime.now() - start_time).total_seconds()
+            response_time = time.perf_counter() - start_time
             self.operation_stats["total_response_time"] += response_time
             
-            logger.info(f"Memory search completed in {response_time:.3f}s, found {len(ranked_results)} results")
+            logger.info("Memory search completed in %.3fs, found %d results", response_time, len(ranked_results))
             
             return ranked_results
             
         except Exception as e:
             self.operation_stats["errors"] += 1
-            logger.error(f"Memory search failed: {e}")
+            logger.error("Memory search failed: %s", e)
             raise GeminiMemoryError(f"Failed to search memory: {e}")
     
     async def _generate_embedding(self, text: str) -> List[float]:
@@ -515,21 +529,15 @@ RESPOND ONLY WITH VALID JSON:
         # Simple embedding generation using text characteristics
         # This is a placeholder - in production, use proper embeddings
         
-        # Create a hash-based vector
-        text_hash = hashlib.md5(text.lower().encode()).hexdigest()
+        # Create a hash-based vector (the raw digest bytes are the hex pairs)
+        text_hash = hashlib.md5(text.lower().encode()).digest()
         
-        # Convert to vector
-        vector = []
-        for i in range(0, len(text_hash), 2):
-            hex_pair = text_hash[i:i+2]
-            vector.append(int(hex_pair, 16) / 255.0)  # Normalize to 0-1
+        # Convert to vector, normalized to 0-1
+        vector = [byte / 255.0 for byte in text_hash]
         
-        # Pad or truncate to desired size
+        # Repeat the hash values to fill, then truncate to the desired size
         target_size = self.config["qdrant"]["vector_size"]
-        while len(vector) < target_size:
-            vector.extend(vector[:min(len(vector), target_size - len(vector))])
-        
-        vector = vector[:target_size]
+        vector = (vector * (target_size // len(vector) + 1))[:target_size]
         
         # Normalize to unit length for cosine similarity
         norm = sum(x ** 2 for x in vector) ** 0.5
@@ -592,21 +600,21 @@ Example: 3,1,7,2,5"""
             return reranked_results[:limit]
             
         except Exception as e:
-            logger.warning(f"Re-ranking failed, using original order: {e}")
+            logger.warning("Re-ranking failed, using original order: %s", e)
             return [self._format_search_result(r) for r in results[:limit]]
     
     def _format_search_result(self, result) -> Dict[str, Any]:
         """Format a Qdrant search result"""
+        payload = result.payload
         return {
             "id": result.id,
-            "text": result.payload.get("text", ""),
-            "category": result.payload.get("category", "unknown"),
-            "importance": result.payload.get("importance", 0),
-            "tags": result.payload.get("tags", []),
+            "text": payload.get("text", ""),
+            "category": payload.get("category", "unknown"),
+            "importance": payload.get("importance", 0),
+            "tags": payload.get("tags", []),
             "score": result.score,
-            "timestamp": result.payload.get("timestamp", ""),
-            "metadata": {k: v for k, v in result.payload.items() 
-                        if k not in ["text", "category", "importance", "tags", "timestamp"]}
+            "timestamp": payload.get("timestamp", ""),
+            "metadata": {k: v for k, v in payload.items() if k not in RESULT_FIELDS}
         }
     
     async def health_check(self) -> Dict[str, Any]:
@@ -677,8 +685,10 @@ async def get_gemini_memory_engine() -> GeminiMemoryEngine:
     global _global_engine
     
     if _global_engine is None:
-        _global_engine = GeminiMemoryEngine()
-        await _global_engine.initialize()
+        # Publish the engine only once it initialized, so a failure is retried next call
+        engine = GeminiMemoryEngine()
+        await engine.initialize()
+        _global_engine = engine
     
     return _global_engine
 
@@ -756,8 +766,9 @@ async def get_chronological_session_context(hours_back: int = 72) -> List[Dict[s
         importance_threshold=5
     )
     
-    # Filter by timestamp and sort chronologically
-    cutoff_time = datetime.now() - timedelta(hours=hours_back)
+    # Filter by timestamp and sort chronologically (one clock read for every episode)
+    now = datetime.now()
+    cutoff_time = now - timedelta(hours=hours_back)
     
     chronological_context = []
     for episode in recent_episodes:
@@ -772,13 +783,13 @@ async def get_chronological_session_context(hours_back: int = 72) -> List[Dict[s
                     chronological_context.append({
                         "timestamp": episode_time,
                         "memory": episode,
-                        "hours_ago": (datetime.now() - episode_time).total_seconds() / 3600
+                        "hours_ago": (now - episode_time).total_seconds() / 3600
                     })
             except Exception:
                 continue
     
     # Sort by timestamp (most recent first)
-    chronological_context.sort(key=lambda x: x["timestamp"], reverse=True)
+    chronological_context.sort(key=itemgetter("timestamp"), reverse=True)
     
     return chronological_context
 
@@ -7,6 +7,7 @@ Enhanced initialization with session restoration and task presentation
 import os
 import sys
 import json
+import heapq
 import subprocess
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -16,18 +17,33 @@ import asyncio
 # Add devenviro to path
 sys.path.append(str(Path(__file__).parent / "devenviro"))
 
-from gemini_memory_engine import GeminiMemoryEngine
-from devenviro import DevEnviroManager
+# Priority given to signoff session todos by their prefix
+SESSION_TODO_PRIORITIES = (
+    ("PRIORITY:", "high"),
+    ("BLOCKER:", "urgent"),
+    ("NEXT:", "medium"),
+)
+
+# Task priority for Linear's numeric issue priority
+LINEAR_PRIORITY_NAMES = {0: 'low', 1: 'low', 2: 'medium', 3: 'high', 4: 'urgent'}
+
+# Startup menu choices that run a devenviro command: choice -> (status line, command)
+MENU_COMMANDS = {
+    "4": ("[DASHBOARD] Starting memory dashboard...", "dashboard"),
+    "5": ("[HEALTH] Running health checks...", "health"),
+    "6": ("[EXTRACT] Extracting session memories...", "extract"),
+}
 
 
 class DevEnviroStartup:
     """Enhanced DevEnviro startup with session restoration and task management"""
     
     def __init__(self):
-        self.manager = DevEnviroManager()
         self.memory_engine = None
         self.current_directory = Path.cwd()
         self.startup_time = datetime.now()
+        self._global_run = None
+        self._health_run = None
         
     async def run_startup_sequence(self):
         """Main startup sequence with enhanced session restoration"""
@@ -35,6 +51,11 @@ class DevEnviroStartup:
         print("=" * 50)
         
         try:
+            # Global init and the memory health probe are independent devenviro runs
+            # (each waits on Gemini/Qdrant) - start both now, report them in order below
+            self._global_run = asyncio.ensure_future(self._run_devenviro("global"))
+            self._health_run = asyncio.ensure_future(self._run_devenviro("health"))
+            
             # Step 1: Initialize global workspace
             await self._initialize_global_workspace()
             
@@ -65,22 +86,34 @@ class DevEnviroStartup:
         
         try:
             # Run devenviro global initialization
-            result = subprocess.run(
-                [sys.executable, "devenviro.py", "global"],
-                capture_output=True,
-                text=True,
-                cwd=self.current_directory
-            )
+            returncode, stdout, stderr = await (self._global_run or self._run_devenviro("global"))
             
-            if result.returncode == 0:
+            if returncode == 0:
                 print("[SUCCESS] Global workspace initialized")
-                print(f"   Output: {result.stdout.strip()}")
+                print(f"   Output: {stdout.strip()}")
             else:
-                print(f"[WARNING] Global workspace warning: {result.stderr.strip()}")
+                print(f"[WARNING] Global workspace warning: {stderr.strip()}")
                 
         except Exception as e:
             print(f"[ERROR] Global workspace initialization failed: {e}")
             
+    async def _run_devenviro(self, *args: str) -> Tuple[int, str, str]:
+        """Run a devenviro.py command without blocking the event loop"""
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "devenviro.py", *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.current_directory
+        )
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            # The result is no longer wanted - don't leave the child running
+            process.kill()
+            await process.wait()
+            raise
+        return process.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+    
     async def _detect_project_context(self) -> Dict:
         """Detect current project context and available projects"""
         print("\n[DETECT] Detecting Project Context...")
@@ -92,21 +125,20 @@ class DevEnviroStartup:
             "project_type": "unknown"
         }
         
-        # Check current directory for DevEnviro project
-        devenviro_dir = self.current_directory / ".devenviro"
-        if devenviro_dir.exists():
-            config_file = devenviro_dir / "config.json"
-            if config_file.exists():
-                try:
-                    with open(config_file, 'r') as f:
-                        config = json.load(f)
-                    project_info["current_project"] = config.get("project_name", self.current_directory.name)
-                    project_info["is_devenviro_project"] = True
-                    project_info["project_type"] = config.get("project_type", "unknown")
-                    print(f"[SUCCESS] Current project: {project_info['current_project']}")
-                    print(f"   Type: {project_info['project_type']}")
-                except Exception as e:
-                    print(f"[WARNING] Config read error: {e}")
+        # Check current directory for DevEnviro project (a missing config means it is not one)
+        config_file = self.current_directory / ".devenviro" / "config.json"
+        try:
+            # Read in a worker thread so the devenviro runs started above keep being serviced
+            config = json.loads(await asyncio.to_thread(config_file.read_bytes))
+            project_info["current_project"] = config.get("project_name", self.current_directory.name)
+            project_info["is_devenviro_project"] = True
+            project_info["project_type"] = config.get("project_type", "unknown")
+            print(f"[SUCCESS] Current project: {project_info['current_project']}")
+            print(f"   Type: {project_info['project_type']}")
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        except Exception as e:
+            print(f"[WARNING] Config read error: {e}")
         
         # Scan for other DevEnviro projects
         home_dir = Path.home()
@@ -118,15 +150,18 @@ class DevEnviroStartup:
         ]
         
         for projects_dir in projects_dirs:
-            if projects_dir.exists():
-                for item in projects_dir.iterdir():
-                    if item.is_dir() and (item / ".devenviro").exists():
-                        if item != self.current_directory:
-                            project_info["available_projects"].append({
-                                "name": item.name,
-                                "path": str(item),
-                                "last_modified": item.stat().st_mtime
-                            })
+            if os.path.isdir(projects_dir):
+                # scandir entries know their type, so only directories are probed for .devenviro
+                with os.scandir(projects_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir() and os.path.exists(os.path.join(entry.path, ".devenviro")):
+                            item = Path(entry.path)
+                            if item != self.current_directory:
+                                project_info["available_projects"].append({
+                                    "name": entry.name,
+                                    "path": entry.path,
+                                    "last_modified": entry.stat().st_mtime
+                                })
         
         print(f"   Found {len(project_info['available_projects'])} other DevEnviro projects")
         
@@ -137,7 +172,9 @@ class DevEnviroStartup:
         print("\n[MEMORY] Initializing Memory Engine...")
         
         try:
-            # Initialize Gemini memory engine
+            # Initialize Gemini memory engine (imported here - it loads the Gemini/Qdrant SDKs)
+            from gemini_memory_engine import GeminiMemoryEngine
+            
             self.memory_engine = GeminiMemoryEngine()
             
             # Test health
@@ -152,6 +189,13 @@ class DevEnviroStartup:
         except Exception as e:
             print(f"[ERROR] Memory engine initialization failed: {e}")
             self.memory_engine = None
+            # The health probe started at launch is pointless without an engine
+            if self._health_run and not self._health_run.done():
+                self._health_run.cancel()
+                try:
+                    await self._health_run
+                except asyncio.CancelledError:
+                    pass
     
     async def _check_memory_health(self) -> Dict:
         """Check memory engine health status"""
@@ -160,21 +204,16 @@ class DevEnviroStartup:
                 return {"healthy": False, "error": "Memory engine not initialized"}
                 
             # Run health check (implement based on existing health check)
-            result = subprocess.run(
-                [sys.executable, "devenviro.py", "health"],
-                capture_output=True,
-                text=True,
-                cwd=self.current_directory
-            )
+            returncode, _, stderr = await (self._health_run or self._run_devenviro("health"))
             
-            if result.returncode == 0:
+            if returncode == 0:
                 return {
                     "healthy": True,
                     "memory_count": "Available",
                     "last_operation": "Recent"
                 }
             else:
-                return {"healthy": False, "error": result.stderr.strip()}
+                return {"healthy": False, "error": stderr.strip()}
                 
         except Exception as e:
             return {"healthy": False, "error": str(e)}
@@ -220,14 +259,9 @@ class DevEnviroStartup:
         """Search for recent episodic memories"""
         try:
             # Use existing DevEnviro search functionality
-            result = subprocess.run(
-                [sys.executable, "devenviro.py", "search", "recent episodic"],
-                capture_output=True,
-                text=True,
-                cwd=self.current_directory
-            )
+            returncode, _, _ = await self._run_devenviro("search", "recent episodic")
             
-            if result.returncode == 0:
+            if returncode == 0:
                 # Parse search results (implement based on actual output format)
                 return [{"content": "Recent memory placeholder", "timestamp": self.startup_time}]
             else:
@@ -252,23 +286,30 @@ class DevEnviroStartup:
         
         # Priority 2: Check for .ai-cli-log directory with recent activity
         log_dir = self.current_directory / ".ai-cli-log"
-        if log_dir.exists():
-            try:
-                # Get recent log files
-                log_files = sorted(log_dir.glob("*.log"), key=lambda x: x.stat().st_mtime, reverse=True)
-                
-                for log_file in log_files[:3]:  # Check last 3 log files
-                    if log_file.stat().st_mtime > (self.startup_time - timedelta(days=1)).timestamp():
-                        # Simulate task extraction (implement actual parsing)
-                        unfinished_tasks.append({
-                            "task": f"Continue work from {log_file.name}",
-                            "priority": "medium",
-                            "source": "log_file",
-                            "timestamp": datetime.fromtimestamp(log_file.stat().st_mtime)
-                        })
-                        
-            except Exception as e:
-                print(f"Log analysis error: {e}")
+        cutoff = (self.startup_time - timedelta(days=1)).timestamp()
+        try:
+            # One directory read; only logs modified since the cutoff are kept
+            recent_logs = []
+            with os.scandir(log_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".log"):
+                        mtime = entry.stat().st_mtime
+                        if mtime > cutoff:
+                            recent_logs.append((mtime, entry.name))
+            
+            # The last 3 recent log files (newest first)
+            for mtime, log_name in heapq.nlargest(3, recent_logs):
+                # Simulate task extraction (implement actual parsing)
+                unfinished_tasks.append({
+                    "task": f"Continue work from {log_name}",
+                    "priority": "medium",
+                    "source": "log_file",
+                    "timestamp": datetime.fromtimestamp(mtime)
+                })
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Log analysis error: {e}")
         
         # Priority 3: Check Linear issues (if available)
         try:
@@ -296,8 +337,10 @@ class DevEnviroStartup:
             session_file = devenviro_dir / "last_session.json"
             
             if session_file.exists():
-                with open(session_file, 'r') as f:
-                    session_data = json.load(f)
+                session_data = json.loads(await asyncio.to_thread(session_file.read_bytes))
+                
+                # Every task from this session shares its timestamp, so parse it once
+                session_time = datetime.fromisoformat(session_data.get("timestamp"))
                 
                 # Extract session todos
                 unfinished_tasks = session_data.get("session_data", {}).get("unfinished_tasks", {})
@@ -305,21 +348,17 @@ class DevEnviroStartup:
                 
                 for todo in session_todos:
                     priority = "high"
-                    if todo.startswith("PRIORITY:"):
-                        priority = "high"
-                        todo = todo.replace("PRIORITY:", "").strip()
-                    elif todo.startswith("BLOCKER:"):
-                        priority = "urgent"
-                        todo = todo.replace("BLOCKER:", "").strip()
-                    elif todo.startswith("NEXT:"):
-                        priority = "medium"
-                        todo = todo.replace("NEXT:", "").strip()
+                    for prefix, prefix_priority in SESSION_TODO_PRIORITIES:
+                        if todo.startswith(prefix):
+                            priority = prefix_priority
+                            todo = todo.replace(prefix, "").strip()
+                            break
                     
                     signoff_tasks.append({
                         "task": todo,
                         "priority": priority,
                         "source": "session_signoff",
-                        "timestamp": datetime.fromisoformat(session_data.get("timestamp"))
+                        "timestamp": session_time
                     })
                 
                 # Extract git work
@@ -329,7 +368,7 @@ class DevEnviroStartup:
                         "task": f"Review uncommitted changes: {', '.join(git_work['uncommitted_work'][:3])}",
                         "priority": "high",
                         "source": "git_status",
-                        "timestamp": datetime.fromisoformat(session_data.get("timestamp"))
+                        "timestamp": session_time
                     })
                 
                 if git_work.get("unpushed_commits"):
@@ -337,7 +376,7 @@ class DevEnviroStartup:
                         "task": "Push unpushed commits to remote",
                         "priority": "medium", 
                         "source": "git_status",
-                        "timestamp": datetime.fromisoformat(session_data.get("timestamp"))
+                        "timestamp": session_time
                     })
                 
                 # Extract code TODOs
@@ -347,7 +386,7 @@ class DevEnviroStartup:
                         "task": f"Review {len(code_todos)} code TODOs in project files",
                         "priority": "low",
                         "source": "code_analysis",
-                        "timestamp": datetime.fromisoformat(session_data.get("timestamp"))
+                        "timestamp": session_time
                     })
                 
                 # Extract Linear issues from signoff
@@ -360,20 +399,19 @@ class DevEnviroStartup:
                         "task": f"Follow up on Linear update: {update}",
                         "priority": "medium",
                         "source": "linear_session_update",
-                        "timestamp": datetime.fromisoformat(session_data.get("timestamp"))
+                        "timestamp": session_time
                     })
                 
                 # Add priority Linear issues as tasks
                 priority_issues = linear_issues.get("priority_issues", [])
                 for issue in priority_issues[:3]:  # Top 3 priority issues
-                    priority_names = {0: 'low', 1: 'low', 2: 'medium', 3: 'high', 4: 'urgent'}
-                    priority = priority_names.get(issue.get('priority', 0), 'medium')
+                    priority = LINEAR_PRIORITY_NAMES.get(issue.get('priority', 0), 'medium')
                     
                     signoff_tasks.append({
                         "task": f"Linear: {issue.get('title', 'Unknown issue')} [{issue.get('state', 'Unknown')}]",
                         "priority": priority,
                         "source": "linear_priority_issue",
-                        "timestamp": datetime.fromisoformat(session_data.get("timestamp")),
+                        "timestamp": session_time,
                         "url": issue.get('url', '')
                     })
                 
@@ -384,7 +422,7 @@ class DevEnviroStartup:
                         "task": f"Review {issues_snapshot['assigned_to_me']} assigned Linear issues",
                         "priority": "medium",
                         "source": "linear_assigned",
-                        "timestamp": datetime.fromisoformat(session_data.get("timestamp"))
+                        "timestamp": session_time
                     })
                 
         except Exception as e:
@@ -461,7 +499,13 @@ class DevEnviroStartup:
         """Handle user menu selection"""
         print()
         
-        if choice == "1":
+        command = MENU_COMMANDS.get(choice)
+        if command:
+            status, command_name = command
+            print(status)
+            subprocess.run([sys.executable, "devenviro.py", command_name])
+            
+        elif choice == "1":
             print("[CONTINUE] Continuing in current project...")
             if project_info["is_devenviro_project"]:
                 print(f"   Project: {project_info['current_project']}")
@@ -476,18 +520,6 @@ class DevEnviroStartup:
         elif choice == "3":
             await self._create_new_project_menu()
             
-        elif choice == "4":
-            print("[DASHBOARD] Starting memory dashboard...")
-            subprocess.run([sys.executable, "devenviro.py", "dashboard"])
-            
-        elif choice == "5":
-            print("[HEALTH] Running health checks...")
-            subprocess.run([sys.executable, "devenviro.py", "health"])
-            
-        elif choice == "6":
-            print("[EXTRACT] Extracting session memories...")
-            subprocess.run([sys.executable, "devenviro.py", "extract"])
-            
         elif choice == "7":
             print("[EXIT] Exiting startup")
             
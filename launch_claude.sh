@@ -134,5 +134,7 @@ else
     echo "DevEnviro workspace is initialized and Claude Code is starting..."
 fi
 
-# Wait a moment for processes to start
-sleep 1
\ No newline at end of file
+# Wait a moment for the backgrounded editor to start (nothing is launched in DevEnviro-only mode)
+if [ $DEVENVIRO_ONLY -eq 0 ]; then
+    sleep 1
+fi
\ No newline at end of file
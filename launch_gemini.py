@@ -6,6 +6,7 @@ Provides flexible launching options for DevEnviro with optional Gemini CLI integ
 
 import os
 import sys
+import shutil
 import subprocess
 import argparse
 from pathlib import Path
@@ -122,16 +123,20 @@ Examples:
         
         gemini_cmd = None
         for cmd_try in gemini_commands:
+            # Look the executable up on PATH first, so missing candidates never spawn a process
+            program, *rest = cmd_try.split()
+            executable = shutil.which(program)
+            if executable is None:
+                continue
             try:
-                # Check if command exists
                 result = subprocess.run(
-                    cmd_try.split() + ["--version"],
+                    [executable, *rest, "--version"],
                     capture_output=True,
                     text=True,
                     timeout=5
                 )
                 if result.returncode == 0:
-                    gemini_cmd = cmd_try.split()
+                    gemini_cmd = [executable, *rest]
                     break
             except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
                 continue
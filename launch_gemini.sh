@@ -169,7 +169,4 @@ elif [ $GEMINI_ONLY -eq 1 ]; then
     echo "Gemini CLI session has ended."
 else
     echo "DevEnviro workspace is initialized and Gemini CLI session has ended."
-fi
-
-# Wait a moment for processes to complete
-sleep 1
\ No newline at end of file
+fi
\ No newline at end of file
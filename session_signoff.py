@@ -5,23 +5,184 @@ Captures session state for smooth startup restoration - "Close to Open" protocol
 """
 
 import os
+import io
+import re
 import sys
 import json
+import heapq
 import subprocess
+import importlib.util
+from functools import cached_property
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import asyncio
 
 # Add devenviro to path
 sys.path.append(str(Path(__file__).parent / "devenviro"))
 
-try:
-    from gemini_memory_engine import GeminiMemoryEngine
-except ImportError:
+# Locate the memory engine without importing it (and its SDKs) until it is needed
+MEMORY_ENGINE_AVAILABLE = importlib.util.find_spec("gemini_memory_engine") is not None
+if not MEMORY_ENGINE_AVAILABLE:
     print("[WARNING] GeminiMemoryEngine not available - limited memory capture")
-    GeminiMemoryEngine = None
 
+# Code comment markers picked up by the TODO scan (bytes form prefilters whole files)
+TODO_PATTERN = re.compile(r"todo|fixme|xxx|hack", re.IGNORECASE)
+TODO_PATTERN_BYTES = re.compile(TODO_PATTERN.pattern.encode(), re.IGNORECASE)
+
+# Files larger than this are skipped by the TODO scan (vendored/generated code)
+MAX_SCAN_BYTES = 2 << 20
+
+# Files the TODO scan reads concurrently (bounds memory held at once)
+TODO_READ_BATCH = 32
+
+# Temporary files removed by the workspace clean-up
+TEMP_FILE_SUFFIXES = (".tmp", ".temp")
+TEMP_FILE_NAMES = frozenset({".DS_Store", "Thumbs.db"})
+
+# Directories never descended into when walking the workspace (besides dot-named ones like .git/.venv)
+SKIP_SCAN_DIRS = frozenset({"node_modules", "__pycache__", "venv"})
+
+# Suffixes of code/text files reported as recently edited
+OPEN_FILE_SUFFIXES = frozenset({".py", ".js", ".ts", ".html", ".css", ".md", ".txt", ".json", ".yaml", ".yml"})
+
+# Suffixes of source files scanned for TODO comments
+TODO_SCAN_SUFFIXES = frozenset({".py", ".js", ".ts", ".html", ".css", ".md"})
+
+# Top-level files recorded in the project structure snapshot
+KEY_PROJECT_FILES = frozenset({"README.md", "package.json", "requirements.txt", "Cargo.toml", "go.mod", "Makefile"})
+
+# Environment variables preserved with the session state
+KEY_ENV_VARS = ("PATH", "NODE_ENV", "PYTHON_PATH", "VIRTUAL_ENV")
+
+# Marker files that identify the project type, checked in order
+PROJECT_TYPE_MARKERS = (
+    (frozenset({"package.json"}), "node.js"),
+    (frozenset({"requirements.txt", "pyproject.toml"}), "python"),
+    (frozenset({"Cargo.toml"}), "rust"),
+    (frozenset({"go.mod"}), "go"),
+)
+
+# Display label for Linear's numeric issue priority
+LINEAR_PRIORITY_LABELS = {0: 'None', 1: 'Low', 2: 'Medium', 3: 'High', 4: 'Urgent'}
+
+# Linear query run once in a subprocess for both Linear captures; prints two lines:
+# open-issue counts (total,assigned,high,recent) and a JSON list of priority/assigned issues
+LINEAR_QUERY_SCRIPT = '''
+import os
+import sys
+import json
+from urllib.request import Request, urlopen
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Load environment variables
+project_root = Path(".").resolve().parent
+env_file = project_root / "config" / "secrets" / ".env"
+load_dotenv(env_file)
+
+api_key = os.getenv("LINEAR_API_KEY")
+if not api_key:
+    print("0,0,0,0")  # Return zeros if no API key
+    print("[]")
+    sys.exit(0)
+
+headers = {
+    "Authorization": api_key,
+    "Content-Type": "application/json",
+    "User-Agent": "apexsigma-devenviro"
+}
+
+# Both issue lists come back from one request
+query = """
+query {
+    openIssues: issues(filter: {state: {type: {nin: ["completed", "canceled"]}}}) {
+        nodes {
+            id
+            title
+            priority
+            assignee { name }
+            updatedAt
+            state { name }
+        }
+    }
+    priorityIssues: issues(filter: {
+        state: {type: {nin: ["completed", "canceled"]}},
+        or: [
+            {priority: {gte: 3}},
+            {assignee: {isNull: false}}
+        ]
+    }, first: 10) {
+        nodes {
+            id
+            title
+            priority
+            assignee { name }
+            state { name }
+            url
+        }
+    }
+    viewer {
+        name
+    }
+}
+"""
+
+try:
+    request = Request("https://api.linear.app/graphql", data=json.dumps({"query": query}).encode(), headers=headers)
+    with urlopen(request, timeout=10) as response:
+        status = response.status
+        data = json.load(response) if status == 200 else None
+except Exception as e:
+    data = None
+
+try:
+    if data is None:
+        raise ValueError("no response")
+    issues = data.get("data", {}).get("openIssues", {}).get("nodes", [])
+    viewer = data.get("data", {}).get("viewer", {}).get("name", "")
+    
+    total_open = len(issues)
+    assigned_to_me = len([i for i in issues if i.get("assignee", {}).get("name") == viewer])
+    high_priority = len([i for i in issues if i.get("priority", 0) >= 3])
+    
+    # Count recently updated (last 24 hours); updatedAt is fixed-width UTC ISO 8601,
+    # so one cutoff string in the same format compares without parsing each issue
+    from datetime import datetime, timedelta, timezone
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    updated_recently = sum(1 for issue in issues if (issue.get("updatedAt") or "") > cutoff)
+    
+    print(f"{total_open},{assigned_to_me},{high_priority},{updated_recently}")
+except Exception as e:
+    print("0,0,0,0")
+
+try:
+    if data is None:
+        raise ValueError("no response")
+    issues = data.get("data", {}).get("priorityIssues", {}).get("nodes", [])
+    viewer_name = data.get("data", {}).get("viewer", {}).get("name", "")
+    
+    priority_issues = []
+    for issue in issues:
+        # Focus on high priority or assigned to current user
+        is_high_priority = issue.get("priority", 0) >= 3
+        is_assigned_to_me = issue.get("assignee", {}).get("name") == viewer_name
+        
+        if is_high_priority or is_assigned_to_me:
+            priority_issues.append({
+                "id": issue.get("id"),
+                "title": issue.get("title", ""),
+                "priority": issue.get("priority", 0),
+                "state": issue.get("state", {}).get("name", ""),
+                "assignee": issue.get("assignee", {}).get("name", ""),
+                "url": issue.get("url", ""),
+                "reason": "high_priority" if is_high_priority else "assigned_to_me"
+            })
+    
+    print(json.dumps(priority_issues))
+except Exception as e:
+    print("[]")
+'''
 
 class SessionSignoff:
     """Session closing and state preservation system"""
@@ -31,7 +192,14 @@ class SessionSignoff:
         self.session_end_time = datetime.now(timezone.utc)
         self.memory_engine = None
         self.session_data = {}
+        # Output lines of the shared Linear query, once it has run
+        self._linear_query_lines = None
         
+    @cached_property
+    def _linear_available(self) -> bool:
+        """Whether the Linear API script is present (checked once per signoff)"""
+        return (self.current_directory / "code" / "test_linear_wsl2.py").exists()
+    
     async def run_signoff_sequence(self):
         """Main session signoff sequence"""
         print("DevEnviro Session Signoff")
@@ -77,7 +245,8 @@ class SessionSignoff:
         print("[MEMORY] Initializing memory engine...")
         
         try:
-            if GeminiMemoryEngine:
+            if MEMORY_ENGINE_AVAILABLE:
+                from gemini_memory_engine import GeminiMemoryEngine
                 self.memory_engine = GeminiMemoryEngine()
                 print("[SUCCESS] Memory engine ready for session capture")
             else:
@@ -116,35 +285,27 @@ class SessionSignoff:
         
         try:
             # Check if git repo
-            result = subprocess.run(
-                ["git", "rev-parse", "--is-inside-work-tree"],
-                capture_output=True,
-                text=True,
-                cwd=self.current_directory
-            )
-            
-            if result.returncode == 0:
+            returncode, _ = await self._run_git("rev-parse", "--is-inside-work-tree")
+            
+            if returncode == 0:
                 git_status["is_git_repo"] = True
                 
-                # Get current branch
-                result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.current_directory
+                # Branch, status and recent commits are independent - query them concurrently
+                branch, status, log = await asyncio.gather(
+                    self._run_git("branch", "--show-current"),
+                    self._run_git("status", "--porcelain"),
+                    self._run_git("log", "--oneline", "-5")
                 )
-                if result.returncode == 0:
-                    git_status["current_branch"] = result.stdout.strip()
+                
+                # Get current branch
+                returncode, stdout = branch
+                if returncode == 0:
+                    git_status["current_branch"] = stdout.strip()
                 
                 # Get status
-                result = subprocess.run(
-                    ["git", "status", "--porcelain"],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.current_directory
-                )
-                if result.returncode == 0:
-                    status_lines = result.stdout.strip().split('\n') if result.stdout.strip() else []
+                returncode, stdout = status
+                if returncode == 0:
+                    status_lines = stdout.strip().split('\n') if stdout.strip() else []
                     git_status["uncommitted_changes"] = len(status_lines) > 0
                     
                     for line in status_lines:
@@ -160,20 +321,26 @@ class SessionSignoff:
                                 git_status["modified_files"].append(file_path)
                 
                 # Get recent commits
-                result = subprocess.run(
-                    ["git", "log", "--oneline", "-5"],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.current_directory
-                )
-                if result.returncode == 0:
-                    git_status["recent_commits"] = result.stdout.strip().split('\n')
+                returncode, stdout = log
+                if returncode == 0:
+                    git_status["recent_commits"] = stdout.strip().split('\n')
                     
         except Exception as e:
             print(f"[WARNING] Git status capture failed: {e}")
             
         return git_status
     
+    async def _run_git(self, *args: str) -> Tuple[int, str]:
+        """Run a git command in the session directory without blocking the event loop"""
+        process = await asyncio.create_subprocess_exec(
+            "git", *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.current_directory
+        )
+        stdout, _ = await process.communicate()
+        return process.returncode, stdout.decode(errors="replace")
+    
     async def _capture_open_files(self) -> List[str]:
         """Capture list of recently modified files"""
         open_files = []
@@ -184,25 +351,39 @@ class SessionSignoff:
             current_time = time.time()
             two_hours_ago = current_time - (2 * 60 * 60)
             
-            for file_path in self.current_directory.rglob("*"):
-                if file_path.is_file() and not any(part.startswith('.') for part in file_path.parts):
-                    try:
-                        if file_path.stat().st_mtime > two_hours_ago:
-                            # Filter for code/text files
-                            if file_path.suffix in ['.py', '.js', '.ts', '.html', '.css', '.md', '.txt', '.json', '.yaml', '.yml']:
-                                open_files.append(str(file_path.relative_to(self.current_directory)))
-                    except (OSError, ValueError):
-                        continue
+            recent_files = []
+            for entry in self._walk_workspace_files(self.current_directory):
+                # Filter for code/text files before touching file metadata
+                if os.path.splitext(entry.name)[1] not in OPEN_FILE_SUFFIXES:
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if mtime > two_hours_ago:
+                    recent_files.append((mtime, os.path.relpath(entry.path, self.current_directory)))
                         
-            # Sort by modification time (most recent first)
-            open_files.sort(key=lambda f: (self.current_directory / f).stat().st_mtime, reverse=True)
-            open_files = open_files[:10]  # Keep top 10
+            # Keep the 10 most recently modified (newest first) without sorting them all
+            open_files = [path for _, path in heapq.nlargest(10, recent_files)]
             
         except Exception as e:
             print(f"[WARNING] Open files capture failed: {e}")
             
         return open_files
     
+    def _walk_workspace_files(self, directory):
+        """Yield file entries under directory, pruning dot-named and SKIP_SCAN_DIRS directories"""
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.') and entry.name not in SKIP_SCAN_DIRS:
+                            yield from self._walk_workspace_files(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            return
+    
     async def _capture_recent_commands(self) -> List[str]:
         """Capture recent command history"""
         recent_commands = []
@@ -211,9 +392,10 @@ class SessionSignoff:
             # Check .ai-cli-log directory
             log_dir = self.current_directory / ".ai-cli-log"
             if log_dir.exists():
-                log_files = sorted(log_dir.glob("*.log"), key=lambda x: x.stat().st_mtime, reverse=True)
+                # Check the last 3 log files (newest first)
+                log_files = heapq.nlargest(3, log_dir.glob("*.log"), key=lambda x: x.stat().st_mtime)
                 
-                for log_file in log_files[:3]:  # Check last 3 log files
+                for log_file in log_files:
                     try:
                         with open(log_file, 'r', encoding='utf-8') as f:
                             lines = f.readlines()
@@ -243,19 +425,16 @@ class SessionSignoff:
         }
         
         try:
-            # Detect project type
-            if (self.current_directory / "package.json").exists():
-                env_state["project_type"] = "node.js"
-            elif (self.current_directory / "requirements.txt").exists() or (self.current_directory / "pyproject.toml").exists():
-                env_state["project_type"] = "python"
-            elif (self.current_directory / "Cargo.toml").exists():
-                env_state["project_type"] = "rust"
-            elif (self.current_directory / "go.mod").exists():
-                env_state["project_type"] = "go"
+            # Detect project type from a single directory listing
+            with os.scandir(self.current_directory) as entries:
+                names = {entry.name for entry in entries}
+            for markers, project_type in PROJECT_TYPE_MARKERS:
+                if not markers.isdisjoint(names):
+                    env_state["project_type"] = project_type
+                    break
             
             # Capture key environment variables
-            key_vars = ["PATH", "NODE_ENV", "PYTHON_PATH", "VIRTUAL_ENV"]
-            for var in key_vars:
+            for var in KEY_ENV_VARS:
                 if var in os.environ:
                     env_state["key_env_vars"][var] = os.environ[var]
                     
@@ -281,9 +460,10 @@ class SessionSignoff:
         """Capture DevEnviro configuration"""
         try:
             config_file = self.current_directory / ".devenviro" / "config.json"
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    return json.load(f)
+            with open(config_file, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
         except Exception as e:
             print(f"[WARNING] DevEnviro config capture failed: {e}")
         return None
@@ -297,18 +477,19 @@ class SessionSignoff:
         }
         
         try:
-            # Count files and directories
-            for item in self.current_directory.iterdir():
-                if item.name.startswith('.'):
-                    continue
-                    
-                if item.is_dir():
-                    structure["directories"].append(item.name)
-                elif item.is_file():
-                    structure["total_files"] += 1
-                    # Track key files
-                    if item.name in ["README.md", "package.json", "requirements.txt", "Cargo.toml", "go.mod", "Makefile"]:
-                        structure["key_files"].append(item.name)
+            # Count files and directories (scandir entries carry their type, no stat per item)
+            with os.scandir(self.current_directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                        
+                    if entry.is_dir():
+                        structure["directories"].append(entry.name)
+                    elif entry.is_file():
+                        structure["total_files"] += 1
+                        # Track key files
+                        if entry.name in KEY_PROJECT_FILES:
+                            structure["key_files"].append(entry.name)
                         
         except Exception as e:
             print(f"[WARNING] Project structure capture failed: {e}")
@@ -360,22 +541,39 @@ class SessionSignoff:
         
         try:
             # Search for TODO/FIXME/XXX comments in code files
-            for file_path in self.current_directory.rglob("*"):
-                if file_path.is_file() and file_path.suffix in ['.py', '.js', '.ts', '.html', '.css', '.md']:
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            lines = f.readlines()
-                            for i, line in enumerate(lines, 1):
-                                line_lower = line.lower()
-                                if any(keyword in line_lower for keyword in ['todo', 'fixme', 'xxx', 'hack']):
-                                    todos.append({
-                                        "file": str(file_path.relative_to(self.current_directory)),
-                                        "line": i,
-                                        "content": line.strip(),
-                                        "type": "code_comment"
-                                    })
-                    except Exception:
+            candidates = []
+            for entry in self._walk_workspace_files(self.current_directory):
+                # Drop files by name first; only code files cost a stat
+                if os.path.splitext(entry.name)[1] not in TODO_SCAN_SUFFIXES:
+                    continue
+                file_path = Path(entry.path)
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                if size > MAX_SCAN_BYTES:
+                    print(f"[INFO] Skipping large file in TODO scan: {file_path.relative_to(self.current_directory)}")
+                    continue
+                candidates.append(file_path)
+            
+            # Read files concurrently in worker threads, a bounded batch at a time
+            for start in range(0, len(candidates), TODO_READ_BATCH):
+                batch = candidates[start:start + TODO_READ_BATCH]
+                results = await asyncio.gather(
+                    *(asyncio.to_thread(self._read_todo_lines, file_path) for file_path in batch),
+                    return_exceptions=True
+                )
+                for file_path, lines in zip(batch, results):
+                    if isinstance(lines, Exception):
                         continue
+                    for i, line in enumerate(lines, 1):
+                        if TODO_PATTERN.search(line):
+                            todos.append({
+                                "file": str(file_path.relative_to(self.current_directory)),
+                                "line": i,
+                                "content": line.strip(),
+                                "type": "code_comment"
+                            })
                         
             # Limit to most recent 20 TODOs
             todos = todos[-20:]
@@ -385,6 +583,14 @@ class SessionSignoff:
             
         return todos
     
+    @staticmethod
+    def _read_todo_lines(file_path: Path) -> List[str]:
+        """Read a UTF-8 text file as lines, or nothing when its raw bytes hold no TODO marker"""
+        data = file_path.read_bytes()
+        if not TODO_PATTERN_BYTES.search(data):
+            return []
+        return io.TextIOWrapper(io.BytesIO(data), encoding='utf-8').readlines()
+    
     async def _capture_session_todos(self) -> List[str]:
         """Capture session-specific todos from user input"""
         session_todos = []
@@ -477,86 +683,15 @@ class SessionSignoff:
         
         try:
             # Check if Linear API test script exists
-            linear_script = self.current_directory / "code" / "test_linear_wsl2.py"
-            if not linear_script.exists():
+            if not self._linear_available:
                 print("[INFO] Linear API script not found, skipping Linear capture")
                 return issues_snapshot
             
             # Run Linear API query for open issues
-            result = subprocess.run([
-                sys.executable, "-c", '''
-import os
-import sys
-import requests
-from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables
-project_root = Path(".").resolve().parent
-env_file = project_root / "config" / "secrets" / ".env"
-load_dotenv(env_file)
-
-api_key = os.getenv("LINEAR_API_KEY")
-if not api_key:
-    print("0,0,0,0")  # Return zeros if no API key
-    sys.exit(0)
-
-headers = {
-    "Authorization": api_key,
-    "Content-Type": "application/json"
-}
-
-query = """
-query {
-    issues(filter: {state: {type: {nin: ["completed", "canceled"]}}}) {
-        nodes {
-            id
-            title
-            priority
-            assignee { name }
-            updatedAt
-            state { name }
-        }
-    }
-    viewer {
-        name
-    }
-}
-"""
-
-try:
-    response = requests.post("https://api.linear.app/graphql", json={"query": query}, headers=headers, timeout=10)
-    if response.status_code == 200:
-        data = response.json()
-        issues = data.get("data", {}).get("issues", {}).get("nodes", [])
-        viewer = data.get("data", {}).get("viewer", {}).get("name", "")
-        
-        total_open = len(issues)
-        assigned_to_me = len([i for i in issues if i.get("assignee", {}).get("name") == viewer])
-        high_priority = len([i for i in issues if i.get("priority", 0) >= 3])
-        
-        # Count recently updated (last 24 hours)
-        from datetime import datetime, timedelta
-        twenty_four_hours_ago = datetime.now() - timedelta(hours=24)
-        updated_recently = 0
-        for issue in issues:
-            try:
-                updated_at = datetime.fromisoformat(issue.get("updatedAt", "").replace("Z", "+00:00"))
-                if updated_at > twenty_four_hours_ago:
-                    updated_recently += 1
-            except:
-                continue
-        
-        print(f"{total_open},{assigned_to_me},{high_priority},{updated_recently}")
-    else:
-        print("0,0,0,0")
-except Exception as e:
-    print("0,0,0,0")
-                '''
-            ], capture_output=True, text=True, cwd=self.current_directory / "code")
+            lines = self._run_linear_query()
             
-            if result.returncode == 0 and result.stdout.strip():
-                counts = result.stdout.strip().split(',')
+            if lines and lines[0].strip():
+                counts = lines[0].strip().split(',')
                 if len(counts) == 4:
                     issues_snapshot.update({
                         "total_open": int(counts[0]),
@@ -600,93 +735,14 @@ except Exception as e:
         
         try:
             # Get recent high-priority and assigned issues
-            linear_script = self.current_directory / "code" / "test_linear_wsl2.py"
-            if not linear_script.exists():
+            if not self._linear_available:
                 return priority_issues
             
-            result = subprocess.run([
-                sys.executable, "-c", '''
-import os
-import sys
-import requests
-import json
-from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables
-project_root = Path(".").resolve().parent
-env_file = project_root / "config" / "secrets" / ".env"
-load_dotenv(env_file)
-
-api_key = os.getenv("LINEAR_API_KEY")
-if not api_key:
-    print("[]")
-    sys.exit(0)
-
-headers = {
-    "Authorization": api_key,
-    "Content-Type": "application/json"
-}
-
-query = """
-query {
-    issues(filter: {
-        state: {type: {nin: ["completed", "canceled"]}},
-        or: [
-            {priority: {gte: 3}},
-            {assignee: {isNull: false}}
-        ]
-    }, first: 10) {
-        nodes {
-            id
-            title
-            priority
-            assignee { name }
-            state { name }
-            url
-        }
-    }
-    viewer {
-        name
-    }
-}
-"""
-
-try:
-    response = requests.post("https://api.linear.app/graphql", json={"query": query}, headers=headers, timeout=10)
-    if response.status_code == 200:
-        data = response.json()
-        issues = data.get("data", {}).get("issues", {}).get("nodes", [])
-        viewer_name = data.get("data", {}).get("viewer", {}).get("name", "")
-        
-        priority_issues = []
-        for issue in issues:
-            # Focus on high priority or assigned to current user
-            is_high_priority = issue.get("priority", 0) >= 3
-            is_assigned_to_me = issue.get("assignee", {}).get("name") == viewer_name
-            
-            if is_high_priority or is_assigned_to_me:
-                priority_issues.append({
-                    "id": issue.get("id"),
-                    "title": issue.get("title", ""),
-                    "priority": issue.get("priority", 0),
-                    "state": issue.get("state", {}).get("name", ""),
-                    "assignee": issue.get("assignee", {}).get("name", ""),
-                    "url": issue.get("url", ""),
-                    "reason": "high_priority" if is_high_priority else "assigned_to_me"
-                })
-        
-        print(json.dumps(priority_issues))
-    else:
-        print("[]")
-except Exception as e:
-    print("[]")
-                '''
-            ], capture_output=True, text=True, cwd=self.current_directory / "code")
+            lines = self._run_linear_query()
             
-            if result.returncode == 0 and result.stdout.strip():
+            if len(lines) > 1 and lines[1].strip():
                 try:
-                    priority_issues = json.loads(result.stdout.strip())
+                    priority_issues = json.loads(lines[1])
                     print(f"[SUCCESS] Identified {len(priority_issues)} priority Linear issues for next session")
                 except json.JSONDecodeError:
                     pass
@@ -696,6 +752,15 @@ except Exception as e:
             
         return priority_issues
     
+    def _run_linear_query(self) -> List[str]:
+        """Output lines of the Linear query, run at most once per signoff"""
+        if self._linear_query_lines is None:
+            result = subprocess.run([
+                sys.executable, "-c", LINEAR_QUERY_SCRIPT
+            ], capture_output=True, text=True, cwd=self.current_directory / "code")
+            self._linear_query_lines = result.stdout.splitlines() if result.returncode == 0 else []
+        return self._linear_query_lines
+    
     async def _save_session_to_memory(self):
         """Save session data to memory engine"""
         print("[MEMORY] Saving session to memory...")
@@ -789,17 +854,18 @@ except Exception as e:
         try:
             # Save to .devenviro directory
             devenviro_dir = self.current_directory / ".devenviro"
-            if not devenviro_dir.exists():
-                devenviro_dir.mkdir(parents=True)
+            devenviro_dir.mkdir(parents=True, exist_ok=True)
             
-            # Save session data
+            # Save session data, serialized up front and swapped in atomically
             session_file = devenviro_dir / "last_session.json"
-            with open(session_file, 'w') as f:
-                json.dump({
-                    "session_summary": session_summary,
-                    "session_data": self.session_data,
-                    "timestamp": self.session_end_time.isoformat()
-                }, f, indent=2)
+            # The temporary name is per process, so concurrent signoffs never share one
+            tmp_file = session_file.with_name(f"{session_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps({
+                "session_summary": session_summary,
+                "session_data": self.session_data,
+                "timestamp": self.session_end_time.isoformat()
+            }, indent=2))
+            os.replace(tmp_file, session_file)
             
             print(f"[SUCCESS] Session data saved to {session_file}")
             
@@ -811,14 +877,14 @@ except Exception as e:
         print("[CLEAN] Preparing workspace...")
         
         try:
-            # Clean up temporary files
-            temp_patterns = ["*.tmp", "*.temp", ".DS_Store", "Thumbs.db"]
+            # Clean up temporary files in a single pass over the tree
             cleaned_files = 0
             
-            for pattern in temp_patterns:
-                for temp_file in self.current_directory.rglob(pattern):
+            for entry in self._walk_workspace_files(self.current_directory):
+                name = entry.name
+                if name in TEMP_FILE_NAMES or name.endswith(TEMP_FILE_SUFFIXES):
                     try:
-                        temp_file.unlink()
+                        os.unlink(entry.path)
                         cleaned_files += 1
                     except Exception:
                         continue
@@ -833,29 +899,28 @@ except Exception as e:
     
     async def _generate_session_report(self):
         """Generate final session report"""
-        print("\n" + "=" * 50)
-        print("SESSION SIGNOFF REPORT")
-        print("=" * 50)
+        # Build the report in memory and write it out in one go
+        report = ["\n" + "=" * 50, "SESSION SIGNOFF REPORT", "=" * 50]
         
         # Session overview
         session_state = self.session_data.get("session_state", {})
-        print(f"Session ended: {self.session_end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Working directory: {session_state.get('working_directory', 'Unknown')}")
+        report.append(f"Session ended: {self.session_end_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        report.append(f"Working directory: {session_state.get('working_directory', 'Unknown')}")
         
         # Git status summary
         git_status = session_state.get("git_status", {})
         if git_status.get("is_git_repo"):
-            print(f"Git branch: {git_status.get('current_branch', 'unknown')}")
+            report.append(f"Git branch: {git_status.get('current_branch', 'unknown')}")
             if git_status.get("uncommitted_changes"):
-                print("[WARNING] Uncommitted changes detected")
+                report.append("[WARNING] Uncommitted changes detected")
                 if git_status.get("staged_files"):
-                    print(f"   Staged files: {len(git_status['staged_files'])}")
+                    report.append(f"   Staged files: {len(git_status['staged_files'])}")
                 if git_status.get("modified_files"):
-                    print(f"   Modified files: {len(git_status['modified_files'])}")
+                    report.append(f"   Modified files: {len(git_status['modified_files'])}")
                 if git_status.get("untracked_files"):
-                    print(f"   Untracked files: {len(git_status['untracked_files'])}")
+                    report.append(f"   Untracked files: {len(git_status['untracked_files'])}")
             else:
-                print("[SUCCESS] Working tree clean")
+                report.append("[SUCCESS] Working tree clean")
         
         # Linear issues summary
         linear_issues = self.session_data.get("linear_issues", {})
@@ -864,23 +929,21 @@ except Exception as e:
         priority_issues = linear_issues.get("priority_issues", [])
         
         if issues_snapshot.get("total_open", 0) > 0:
-            print(f"\n[LINEAR] LINEAR ISSUES STATUS:")
-            print(f"   Total open: {issues_snapshot['total_open']}")
-            print(f"   Assigned to you: {issues_snapshot['assigned_to_me']}")
-            print(f"   High priority: {issues_snapshot['high_priority']}")
-            print(f"   Updated recently: {issues_snapshot['updated_recently']}")
+            report.append(f"\n[LINEAR] LINEAR ISSUES STATUS:")
+            report.append(f"   Total open: {issues_snapshot['total_open']}")
+            report.append(f"   Assigned to you: {issues_snapshot['assigned_to_me']}")
+            report.append(f"   High priority: {issues_snapshot['high_priority']}")
+            report.append(f"   Updated recently: {issues_snapshot['updated_recently']}")
             
             if session_updates:
-                print(f"   Session updates:")
-                for update in session_updates:
-                    print(f"     - {update}")
+                report.append(f"   Session updates:")
+                report.extend(f"     - {update}" for update in session_updates)
             
             if priority_issues:
-                print(f"   Priority issues for next session: {len(priority_issues)}")
+                report.append(f"   Priority issues for next session: {len(priority_issues)}")
                 for issue in priority_issues[:3]:  # Show top 3
-                    priority_names = {0: 'None', 1: 'Low', 2: 'Medium', 3: 'High', 4: 'Urgent'}
-                    priority_str = priority_names.get(issue.get('priority', 0), 'Unknown')
-                    print(f"     - [{priority_str}] {issue.get('title', '')[:50]}...")
+                    priority_str = LINEAR_PRIORITY_LABELS.get(issue.get('priority', 0), 'Unknown')
+                    report.append(f"     - [{priority_str}] {issue.get('title', '')[:50]}...")
         
         # Unfinished work summary
         unfinished_tasks = self.session_data.get("unfinished_tasks", {})
@@ -888,23 +951,25 @@ except Exception as e:
         code_todos = unfinished_tasks.get("code_todos", [])
         
         if session_todos or code_todos:
-            print("\n[TASKS] UNFINISHED WORK:")
-            for todo in session_todos:
-                print(f"   - {todo}")
+            report.append("\n[TASKS] UNFINISHED WORK:")
+            report.extend(f"   - {todo}" for todo in session_todos)
             if code_todos:
-                print(f"   - {len(code_todos)} code TODOs found")
+                report.append(f"   - {len(code_todos)} code TODOs found")
         else:
-            print("\n[SUCCESS] No unfinished work noted")
+            report.append("\n[SUCCESS] No unfinished work noted")
         
         # Next session prep
-        print("\n[READY] NEXT SESSION READY:")
-        print("   - Session state captured")
-        print("   - Project state preserved")
-        print("   - Unfinished tasks recorded")
-        print("   - Workspace cleaned")
-        
-        print("\nRun startup script to restore session context!")
-
+        report.extend([
+            "\n[READY] NEXT SESSION READY:",
+            "   - Session state captured",
+            "   - Project state preserved",
+            "   - Unfinished tasks recorded",
+            "   - Workspace cleaned",
+            "\nRun startup script to restore session context!",
+        ])
+        
+        sys.stdout.write("\n".join(report) + "\n")
+        sys.stdout.flush()
 
 async def main():
     """Main signoff entry point"""